@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# Motor de alerte incremental pentru riscul de lichidare.
+# Fiecare actualizare de risc se evaluează în O(1) pentru poziția respectivă,
+# identificată prin (cont, simbol, direcție): același simbol în două conturi
+# sau LONG și SHORT în hedge mode au stări separate.
+#
+# - histerezis: alerta pornește când riscul scade sub RISK_THRESHOLD și se
+#   rearmează abia după ce riscul urcă peste RISK_CLEAR (fără alerte în rafală
+#   când riscul oscilează în jurul pragului);
+# - escaladare: în alarmă, o nouă alertă doar dacă riscul a mai scăzut cu cel
+#   puțin MIN_RISK_CHANGE_FOR_ALERT față de ultima alertă;
+# - cooldown per poziție și limită globală pe oră; alertele în așteptare stau
+#   într-o coadă cu priorități (riscul cel mai mic = cel mai urgent).
+#
+# Starea e ținută în memorie și scrisă periodic în alert-cache.json, fișier
+# comun cu liquidation-alert.js. Pozițiile fără cont și fără hedge mode
+# (account '', side BOTH) folosesc cheia lui: simbolul, cu lastAlertTime și
+# lastRisk, deci cele două scripturi își văd cooldown-urile. Celelalte au cheia
+# "cont:simbol:direcție" și câmpurile account, symbol, side. La scriere se
+# actualizează doar intrările alertelor trimise de motor, peste conținutul
+# curent al fișierului: intrările scrise de liquidation-alert.js rămân.
+# O poziție nouă dintr-un cont sau hedge mode pornește de la starea
+# intrării cu simbolul ei, dacă există.
+
+import heapq
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+# Configurare (aceleași valori ca în liquidation-alert.js)
+RISK_THRESHOLD = 0.1
+RISK_CLEAR = 0.12
+MIN_RISK_CHANGE_FOR_ALERT = 0.02
+ALERT_COOLDOWN_MINUTES = 10
+MAX_ALERTS_PER_HOUR = 5
+
+FLUSH_INTERVAL_SECONDS = 30
+POLL_INTERVAL_SECONDS = 5
+
+CACHE_FILE = 'alert-cache.json'
+STATUS_FILE = 'binance-status.json'
+
+TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
+TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
+
+
+def to_iso(timestamp):
+    moment = datetime.fromtimestamp(timestamp, timezone.utc)
+    return moment.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def from_iso(value):
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+
+# Cheia unei poziții: (cont, simbol, direcție); scripturile cu un singur cont
+# nu scriu 'account'
+def position_key(pos):
+    return pos.get('account', ''), pos['symbol'], pos.get('side', 'BOTH')
+
+
+# Cheia din alert-cache.json: simbolul simplu pentru contul implicit (ca în
+# liquidation-alert.js), altfel cont:simbol:direcție
+def cache_key(key):
+    account, symbol, side = key
+    if account == '' and side == 'BOTH':
+        return symbol
+    return ':'.join(key)
+
+
+def read_cache(path):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class AlertEngine:
+    def __init__(self, cache_path=CACHE_FILE, flush_interval=FLUSH_INTERVAL_SECONDS, clock=time.time):
+        self.cache_path = cache_path
+        self.flush_interval = flush_interval
+        self.clock = clock
+
+        # Tabelul de stare: (cont, simbol, direcție) -> {risk, armed, last_alert_time, last_risk}
+        self.state = {}
+        # Stări din alert-cache.json cu simbolul drept cheie (simbol -> stare)
+        self.legacy = {}
+        self.dirty = set()
+        self.last_flush = clock()
+
+        # Alerte în așteptare: cel mult una per poziție (ultima o înlocuiește pe
+        # cea veche, intrările vechi din heap-uri sunt ignorate la extragere)
+        self.pending = {}
+        self.waiting = []           # (ready_at, seq, cheie), până expiră cooldown-ul
+        self.ready = []             # (risk, seq, cheie), gata de trimis
+        self.seq = 0
+        self.sent_times = deque()   # pentru limita pe oră
+
+        self.load()
+
+    # Funcție pentru încărcarea stării din alert-cache.json (o singură dată)
+    def load(self):
+        for name, entry in read_cache(self.cache_path).items():
+            last_risk = entry.get('lastRisk')
+            state = {
+                'risk': last_risk,
+                # O poziție care era în alarmă rămâne în alarmă după repornire
+                'armed': last_risk is None or last_risk > RISK_THRESHOLD,
+                'last_alert_time': from_iso(entry['lastAlertTime']) if entry.get('lastAlertTime') else None,
+                'last_risk': last_risk,
+            }
+            if 'symbol' in entry:
+                self.state[position_key(entry)] = state
+            else:
+                self.state[('', name, 'BOTH')] = state
+                self.legacy[name] = dict(state)
+
+    def state_for(self, key):
+        state = self.state.get(key)
+        if state is None:
+            legacy = self.legacy.get(key[1])
+            state = dict(legacy) if legacy else {'risk': None, 'armed': True, 'last_alert_time': None, 'last_risk': None}
+            self.state[key] = state
+        return state
+
+    # Funcție pentru evaluarea unei actualizări de risc (O(1))
+    def update(self, key, risk, position=None, now=None):
+        now = self.clock() if now is None else now
+        state = self.state_for(key)
+        state['risk'] = risk
+
+        if risk >= RISK_CLEAR:
+            if not state['armed']:
+                state['armed'] = True
+                self.pending.pop(key, None)
+            return
+
+        if state['armed'] and risk <= RISK_THRESHOLD:
+            state['armed'] = False
+            self.enqueue(key, 'critical', risk, position, now)
+        elif not state['armed'] and state['last_risk'] is not None \
+                and state['last_risk'] - risk >= MIN_RISK_CHANGE_FOR_ALERT:
+            kind = self.pending[key]['kind'] if key in self.pending else 'escalation'
+            self.enqueue(key, kind, risk, position, now)
+        elif key in self.pending:
+            # Alerta în așteptare primește riscul cel mai recent
+            self.enqueue(key, self.pending[key]['kind'], risk, position, now)
+
+    # Funcție pentru actualizarea mai multor poziții: doar pozițiile schimbate
+    def update_many(self, positions, now=None):
+        now = self.clock() if now is None else now
+        changed = 0
+        for pos in positions:
+            key = position_key(pos)
+            state = self.state.get(key)
+            if state is not None and state['risk'] == pos['risk']:
+                continue
+            self.update(key, pos['risk'], pos, now)
+            changed += 1
+        return changed
+
+    def enqueue(self, key, kind, risk, position, now):
+        self.seq += 1
+        account, symbol, side = key
+        self.pending[key] = {
+            'key': key, 'account': account, 'symbol': symbol, 'side': side,
+            'kind': kind, 'risk': risk, 'position': position, 'seq': self.seq,
+        }
+
+        last = self.state[key]['last_alert_time']
+        ready_at = now if last is None else max(now, last + ALERT_COOLDOWN_MINUTES * 60)
+        heapq.heappush(self.waiting, (ready_at, self.seq, key))
+
+    def is_current(self, seq, key):
+        alert = self.pending.get(key)
+        return alert is not None and alert['seq'] == seq
+
+    # Funcție pentru extragerea alertelor care pot fi trimise acum
+    def pop_ready(self, now=None):
+        now = self.clock() if now is None else now
+
+        # Cooldown-ul a expirat: alerta trece în coada pe priorități
+        while self.waiting and self.waiting[0][0] <= now:
+            _, seq, key = heapq.heappop(self.waiting)
+            if self.is_current(seq, key):
+                heapq.heappush(self.ready, (self.pending[key]['risk'], seq, key))
+
+        while self.sent_times and now - self.sent_times[0] >= 3600:
+            self.sent_times.popleft()
+
+        alerts = []
+        while self.ready and len(self.sent_times) < MAX_ALERTS_PER_HOUR:
+            _, seq, key = heapq.heappop(self.ready)
+            if not self.is_current(seq, key):
+                continue
+            alert = self.pending.pop(key)
+            self.mark_sent(alert, now)
+            alerts.append(alert)
+        return alerts
+
+    def mark_sent(self, alert, now):
+        state = self.state[alert['key']]
+        state['last_alert_time'] = now
+        state['last_risk'] = alert['risk']
+        self.sent_times.append(now)
+        self.dirty.add(alert['key'])
+
+    # Funcție pentru scrierea periodică a stării în alert-cache.json
+    def flush(self, force=False, now=None):
+        now = self.clock() if now is None else now
+        if not self.dirty or (not force and now - self.last_flush < self.flush_interval):
+            return False
+
+        # Doar alertele trimise de motor, peste ce e acum în fișier
+        cache = read_cache(self.cache_path)
+        for key in self.dirty:
+            state = self.state[key]
+            entry = {'lastAlertTime': to_iso(state['last_alert_time']), 'lastRisk': state['last_risk']}
+            name = cache_key(key)
+            if name != key[1]:
+                entry = {'account': key[0], 'symbol': key[1], 'side': key[2], **entry}
+            cache[name] = entry
+        directory = os.path.dirname(os.path.abspath(self.cache_path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.json')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp, self.cache_path)
+
+        self.dirty.clear()
+        self.last_flush = now
+        return True
+
+
+# Funcție pentru textul alertei (ca în liquidation-alert.js)
+def format_alert(alert):
+    pos = alert['position'] or {}
+    title = "🚨 *ALERTĂ RISC ÎNALT*" if alert['kind'] == 'critical' else "⚠️ *RISC ÎN CREȘTERE*"
+    lines = [
+        title,
+        f"📊 *Simbol:* {alert['symbol']}" + (f" {alert['side']}" if alert['side'] != 'BOTH' else ""),
+        f"💥 *Risc:* {alert['risk'] * 100:.2f}% (sub {RISK_THRESHOLD * 100:g}%)",
+    ]
+    if alert['account']:
+        lines.insert(1, f"👤 *Cont:* {alert['account']}")
+    if 'current_price' in pos:
+        lines.append(f"💰 *Preț curent:* {pos['current_price']:.2f}")
+    if 'liquidation_price' in pos:
+        lines.append(f"🛑 *Preț lichidare:* {pos['liquidation_price']:.2f}")
+    lines.append("🔴 *Acțiune:* Monitorizează sau închide poziția!")
+    return "\n".join(lines)
+
+
+# Funcție pentru trimiterea alertelor în Telegram (DRY RUN fără token)
+def send_alert(message):
+    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
+        print(f"[DRY RUN] Telegram Alert: {message}")
+        return
+    import requests
+
+    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+    params = {'chat_id': TELEGRAM_CHAT_ID, 'text': message, 'parse_mode': 'Markdown'}
+    delay = 1
+    for attempt in range(3):
+        try:
+            requests.post(url, json=params, timeout=10).raise_for_status()
+            print("Alertă trimisă în Telegram.")
+            return
+        except requests.RequestException as e:
+            if attempt == 2:
+                print(f"Eroare la trimiterea alertelor în Telegram (ultima încercare): {e}")
+                return
+            time.sleep(delay)
+            delay *= 2
+
+
+def read_positions(path=STATUS_FILE):
+    with open(path, 'r') as f:
+        return json.load(f).get('positions', [])
+
+
+# Funcție principală: o evaluare, sau --watch pentru fluxul de actualizări
+def main():
+    watch = '--watch' in sys.argv
+    engine = AlertEngine()
+    last_mtime = None
+
+    try:
+        while True:
+            mtime = os.path.getmtime(STATUS_FILE)
+            if mtime != last_mtime:
+                last_mtime = mtime
+                changed = engine.update_many(read_positions())
+                print(f"Verificare risc lichidare: {changed} poziții schimbate.")
+
+            for alert in engine.pop_ready():
+                send_alert(format_alert(alert))
+            engine.flush(force=not watch)
+
+            if not watch:
+                break
+            time.sleep(POLL_INTERVAL_SECONDS)
+    finally:
+        engine.flush(force=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+MathCLI Pro - Batched Lagged Animations
+Drop-in replacements for LaggedStartMap(FadeIn / GrowFromCenter, group)
+over groups of thousands of dots, squares or texts.
+
+LaggedStartMap builds one Animation (and one starting copy) per submobject
+and interpolates each of them in Python on every frame. Here the group is
+animated as a whole: at begin() the points and fill/stroke colors of every
+leaf are stacked into contiguous arrays, and each leaf's own arrays become
+views into them. A frame is then a handful of numpy operations over the
+whole group (per-element lagged alpha, scale about the element's center,
+shift, opacity), with no per-submobject Python.
+
+The timing matches LaggedStartMap: element i starts at i * lag_ratio of a
+sub-animation run time and the group's run_time covers all of them. A bare
+PMobject point cloud is animated the same way, one element per point.
+"""
+
+import numpy as np
+from manim import ORIGIN, Animation, linear, smooth
+
+# Samples used to evaluate a scalar rate function on whole arrays
+RATE_SAMPLES = 1025
+
+POINTS, FILL, STROKE = "points", "fill", "stroke"
+
+# Attribute holding each array; a PMobject keeps its colors in rgbas
+LEAF_ATTRS = {
+    POINTS: lambda leaf: "points",
+    FILL: lambda leaf: "fill_rgbas" if hasattr(leaf, "fill_rgbas") else "rgbas",
+    STROKE: lambda leaf: "stroke_rgbas" if hasattr(leaf, "fill_rgbas") else None,
+}
+
+
+def leaf_array(leaf, kind):
+    attr = LEAF_ATTRS[kind](leaf)
+    return getattr(leaf, attr) if attr else None
+
+
+class BatchedLaggedStart(Animation):
+    """
+    Lagged opacity / scale / shift animation of every submobject of a group
+    Usage: self.play(BatchedLaggedStart(dots, scale=0, lag_ratio=0.002), run_time=4)
+    """
+
+    def __init__(self, group, fade=True, scale=1.0, shift=ORIGIN, lag_ratio=0.05,
+                 element_rate_func=smooth, rate_func=linear, introducer=True, **kwargs):
+        super().__init__(group, lag_ratio=lag_ratio, rate_func=rate_func, introducer=introducer, **kwargs)
+        self.fade = fade
+        self.start_scale = scale
+        self.shift = np.asarray(shift, dtype=float)
+        self.element_rate_func = element_rate_func
+
+    def begin(self):
+        if self.run_time <= 0:
+            raise ValueError(f"{self} has a run_time of <= 0 seconds")
+        if self.suspend_mobject_updating:
+            self.mobject.suspend_updating()
+
+        self.leaves = []
+        point_owner, fill_owner, stroke_owner, centers = [], [], [], []
+        if not self.mobject.submobjects and not hasattr(self.mobject, "fill_rgbas"):
+            # A point cloud (PMobject) is animated point by point
+            cloud = self.mobject
+            self.n_elements = len(cloud.points)
+            # A point has no size to grow from: fade it in instead
+            self.fade = self.fade or self.start_scale != 1
+            if self.n_elements:
+                self.leaves.append(cloud)
+                point_owner.append(np.arange(self.n_elements))
+                fill_owner.append(np.arange(len(cloud.rgbas)))
+                centers.extend(cloud.points)
+        else:
+            elements = self.mobject.submobjects or [self.mobject]
+            self.n_elements = len(elements)
+            for i, element in enumerate(elements):
+                centers.append(element.get_center())
+                for leaf in element.get_family():
+                    if len(leaf.points) == 0:
+                        continue
+                    self.leaves.append(leaf)
+                    point_owner.append(np.full(len(leaf.points), i))
+                    fill_owner.append(np.full(len(leaf.fill_rgbas), i))
+                    stroke_owner.append(np.full(len(leaf.stroke_rgbas), i))
+
+        self.animate_points = self.start_scale != 1 or self.shift.any()
+        self.point_owner = np.concatenate(point_owner) if point_owner else np.zeros(0, dtype=int)
+        self.fill_owner = np.concatenate(fill_owner) if fill_owner else np.zeros(0, dtype=int)
+        self.stroke_owner = np.concatenate(stroke_owner) if stroke_owner else np.zeros(0, dtype=int)
+
+        # Final state, plus the working buffers the leaves point into
+        self.target_points = self.stack("points")
+        self.target_fill = self.stack(FILL)
+        self.target_stroke = self.stack(STROKE)
+        self.points = self.target_points.copy()
+        self.fill = self.target_fill.copy()
+        self.stroke = self.target_stroke.copy()
+        self.bind_views()
+
+        self.centers = np.array(centers).reshape(-1, 3)[self.point_owner]
+        self.offsets = self.target_points - self.centers
+        samples = np.linspace(0, 1, RATE_SAMPLES)
+        self.rate_table = np.array([self.element_rate_func(t) for t in samples])
+        self.interpolate(0)
+
+    def stack(self, kind):
+        arrays = [leaf_array(leaf, kind) for leaf in self.leaves]
+        arrays = [array for array in arrays if array is not None]
+        width = 3 if kind == POINTS else 4
+        return np.concatenate(arrays) if arrays else np.zeros((0, width))
+
+    def bind_views(self):
+        """Make every leaf's points / rgbas a slice of the shared buffers"""
+        self.assign(self.points, self.fill, self.stroke, copy=False)
+
+    def assign(self, points, fill, stroke, copy):
+        offsets = {POINTS: 0, FILL: 0, STROKE: 0}
+        for leaf in self.leaves:
+            for kind, buffer in ((POINTS, points), (FILL, fill), (STROKE, stroke)):
+                array = leaf_array(leaf, kind)
+                if array is None:
+                    continue
+                start = offsets[kind]
+                offsets[kind] += len(array)
+                view = buffer[start:offsets[kind]]
+                setattr(leaf, LEAF_ATTRS[kind](leaf), view.copy() if copy else view)
+
+    def element_alphas(self, alpha):
+        """Per-element progress, same timing as LaggedStartMap"""
+        total = (self.n_elements - 1) * self.lag_ratio + 1
+        starts = np.arange(self.n_elements) * self.lag_ratio
+        local = np.clip(alpha * total - starts, 0, 1)
+        return np.interp(local, np.linspace(0, 1, RATE_SAMPLES), self.rate_table)
+
+    def interpolate_mobject(self, alpha):
+        if not self.leaves:
+            return
+        progress = self.element_alphas(alpha)
+
+        if self.animate_points:
+            t = progress[self.point_owner][:, None]
+            scale = self.start_scale + (1 - self.start_scale) * t
+            np.multiply(self.offsets, scale, out=self.points)
+            self.points += self.centers
+            self.points += (1 - t) * self.shift
+
+        if self.fade:
+            self.fill[:, 3] = self.target_fill[:, 3] * progress[self.fill_owner]
+            self.stroke[:, 3] = self.target_stroke[:, 3] * progress[self.stroke_owner]
+
+    def finish(self):
+        # Exact final values, and each leaf gets its own arrays back
+        self.assign(self.target_points, self.target_fill, self.target_stroke, copy=True)
+        self.points = self.fill = self.stroke = None
+        if self.suspend_mobject_updating:
+            self.mobject.resume_updating()
+
+
+class BatchedFadeIn(BatchedLaggedStart):
+    """LaggedStartMap(FadeIn, group, shift=...) as one vectorized animation"""
+
+    def __init__(self, group, shift=ORIGIN, lag_ratio=0.05, **kwargs):
+        super().__init__(group, fade=True, shift=shift, lag_ratio=lag_ratio, **kwargs)
+
+
+class BatchedGrowFromCenter(BatchedLaggedStart):
+    """LaggedStartMap(GrowFromCenter, group) as one vectorized animation"""
+
+    def __init__(self, group, lag_ratio=0.05, **kwargs):
+        super().__init__(group, fade=False, scale=0.0, lag_ratio=lag_ratio, **kwargs)
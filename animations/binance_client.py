@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# Client comun pentru API-ul Binance Futures, folosit de toate scripturile.
+#
+# - Token bucket pe greutatea request-urilor (limita Binance: 2400 / minut),
+#   sincronizat cu header-ul X-MBX-USED-WEIGHT-1M din fiecare răspuns.
+# - Retry cu backoff exponențial (și Retry-After pentru 429 / 418).
+# - Request-urile identice aflate deja în zbor sunt comasate: al doilea
+#   apelant așteaptă rezultatul primului în loc să trimită încă un request.
+# - Cache TTL pentru ticker și exchangeInfo, comun tuturor conturilor din proces.
+
+import hashlib
+import hmac
+import random
+import threading
+import time
+from concurrent.futures import Future
+from urllib.parse import urlencode
+
+import requests
+
+BASE_URL = "https://fapi.binance.com"
+
+WEIGHT_LIMIT_1M = 2400
+WEIGHT_HEADER = "X-MBX-USED-WEIGHT-1M"
+
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30
+REQUEST_TIMEOUT = 10
+
+TICKER_TTL = 2
+EXCHANGE_INFO_TTL = 300
+
+# Greutățile endpoint-urilor folosite (documentația Binance USDⓈ-M Futures)
+ENDPOINT_WEIGHTS = {
+    "/fapi/v2/positionRisk": 5,
+    "/fapi/v2/account": 5,
+    "/fapi/v2/balance": 5,
+    "/fapi/v1/exchangeInfo": 1,
+    "/fapi/v1/ticker/price": 2,     # 1 pentru un singur simbol
+}
+
+
+class BinanceAPIError(Exception):
+    def __init__(self, status, message):
+        super().__init__(f"Binance API {status}: {message}")
+        self.status = status
+
+
+# Token bucket pe greutate: se reumple liniar până la limită într-un minut
+class WeightBucket:
+    def __init__(self, capacity=WEIGHT_LIMIT_1M, period=60):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, weight):
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= weight:
+                    self.tokens -= weight
+                    return
+                wait = (weight - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def sync(self, used_weight):
+        # Serverul știe exact cât am consumat (inclusiv alte procese cu același IP)
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.tokens, self.capacity - used_weight)
+
+    def pause(self, seconds):
+        # După 429 / 418 golim bucket-ul pentru durata cerută de server
+        with self.lock:
+            self.tokens = -seconds * self.rate
+            self.updated = time.monotonic()
+
+
+class TTLCache:
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if time.monotonic() >= expires:
+                del self.entries[key]
+                return None
+            return value
+
+    def set(self, key, value, ttl):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + ttl, value)
+
+
+# Stare comună tuturor clienților din proces (aceeași limită pe IP)
+shared_bucket = WeightBucket()
+shared_cache = TTLCache()
+shared_session = requests.Session()
+
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+
+class BinanceClient:
+    def __init__(self, api_key=None, api_secret=None, base_url=BASE_URL,
+                 session=None, bucket=None, cache=None):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.base_url = base_url
+        self.session = session or shared_session
+        self.bucket = bucket or shared_bucket
+        self.cache = cache or shared_cache
+
+    # Funcție pentru semnarea request-urilor
+    def sign(self, params):
+        params = dict(params, timestamp=int(time.time() * 1000), recvWindow=5000)
+        query_string = urlencode(params)
+        signature = hmac.new(
+            self.api_secret.encode('utf-8'),
+            query_string.encode('utf-8'),
+            hashlib.sha256
+        ).hexdigest()
+        return f"{query_string}&signature={signature}"
+
+    def get(self, path, params=None, signed=False, weight=None, ttl=None):
+        params = params or {}
+        # Request-urile semnate sunt per cont: cheia include API key-ul
+        key = (self.base_url, path, tuple(sorted(params.items())), self.api_key if signed else None)
+
+        if ttl is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        # Comasare: dacă același request e deja în zbor, așteptăm rezultatul lui
+        with _in_flight_lock:
+            future = _in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = _in_flight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            result = self._request(path, params, signed, weight or ENDPOINT_WEIGHTS.get(path, 1))
+            if ttl is not None:
+                self.cache.set(key, result, ttl)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _in_flight_lock:
+                del _in_flight[key]
+
+    def _request(self, path, params, signed, weight):
+        headers = {'X-MBX-APIKEY': self.api_key} if self.api_key else {}
+
+        for attempt in range(MAX_RETRIES + 1):
+            self.bucket.acquire(weight)
+            # Semnăm la fiecare încercare: timestamp-ul trebuie să fie proaspăt
+            query = self.sign(params) if signed else urlencode(params)
+            url = f"{self.base_url}{path}" + (f"?{query}" if query else "")
+            try:
+                response = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            except requests.RequestException:
+                if attempt == MAX_RETRIES:
+                    raise
+                time.sleep(self._backoff(attempt))
+                continue
+
+            used = response.headers.get(WEIGHT_HEADER)
+            if used is not None:
+                self.bucket.sync(int(used))
+
+            if response.status_code in (429, 418):
+                retry_after = float(response.headers.get('Retry-After', self._backoff(attempt)))
+                self.bucket.pause(retry_after)
+                if attempt == MAX_RETRIES:
+                    raise BinanceAPIError(response.status_code, response.text)
+                continue
+            if response.status_code >= 500 and attempt < MAX_RETRIES:
+                time.sleep(self._backoff(attempt))
+                continue
+            if response.status_code >= 400:
+                raise BinanceAPIError(response.status_code, response.text)
+            return response.json()
+
+    @staticmethod
+    def _backoff(attempt):
+        return min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+    # Endpoint-uri folosite de scripturi
+
+    def positions(self):
+        return self.get("/fapi/v2/positionRisk", signed=True)
+
+    def account(self):
+        return self.get("/fapi/v2/account", signed=True)
+
+    def ticker_prices(self):
+        # Toate prețurile într-un request (greutate 2) în loc de unul per simbol
+        data = self.get("/fapi/v1/ticker/price", ttl=TICKER_TTL)
+        return {item['symbol']: float(item['price']) for item in data}
+
+    def exchange_info(self):
+        return self.get("/fapi/v1/exchangeInfo", ttl=EXCHANGE_INFO_TTL)
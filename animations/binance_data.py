@@ -1,25 +1,27 @@
 import json
-from binance.client import Client
+
+from binance_client import BinanceClient
 
 def fetch_binance_data(api_key, api_secret):
-    client = Client(api_key, api_secret)
+    client = BinanceClient(api_key, api_secret)
 
     # Get account info
-    account = client.futures_account()
+    account = client.account()
     balances = [
         {"asset": b["asset"], "usd_value": float(b["balance"]) * float(b.get("usdValue", 0))}
         for b in account["assets"]
         if float(b["balance"]) > 0
     ]
 
-    # Get open positions
+    # Get open positions (prices come from one cached ticker request)
+    prices = client.ticker_prices()
     positions = []
     for pos in account["positions"]:
         if float(pos["positionAmt"]) != 0:
             symbol = pos["symbol"]
             leverage = float(pos["leverage"])
             liquidation_price = float(pos["liquidationPrice"])
-            current_price = float(client.futures_symbol_ticker(symbol=symbol)["price"])
+            current_price = prices[symbol]
             positions.append({
                 "symbol": symbol,
                 "leverage": leverage,
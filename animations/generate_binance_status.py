@@ -4,58 +4,36 @@
 
 import os
 import json
-import hmac
-import hashlib
-import time
-import requests
-from urllib.parse import urlencode
+
+from binance_client import BinanceClient
+from liquidation_sim import (
+    HORIZON_HOURS, add_liquidation_probabilities, load_history, save_history, update_history
+)
 
 # Citim API Key și Secret Key din variabile de mediu
 BINANCE_API_KEY = os.getenv('BINANCE_API_KEY')
 BINANCE_SECRET_KEY = os.getenv('BINANCE_SECRET_KEY')
 
-if not BINANCE_API_KEY or not BINANCE_SECRET_KEY:
-    raise ValueError("API Key și Secret Key pentru Binance nu sunt setate în variabilele de mediu.")
-
-# URL-uri API Binance
-BASE_URL = "https://fapi.binance.com"
-ENDPOINT_POSITIONS = "/fapi/v2/positionRisk"
-ENDPOINT_ACCOUNT = "/fapi/v2/account"
+# Clientul comun (limită de greutate, retry, cache pentru prețuri), creat la
+# prima utilizare ca modulul să poată fi importat și fără chei (calculate_risk)
+_client = None
 
-# Funcție pentru semnarea request-urilor
-def sign_request(params):
-    query_string = urlencode(params)
-    signature = hmac.new(
-        BINANCE_SECRET_KEY.encode('utf-8'),
-        query_string.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
-    return f"{query_string}&signature={signature}"
+def get_client():
+    global _client
+    if _client is None:
+        if not BINANCE_API_KEY or not BINANCE_SECRET_KEY:
+            raise ValueError("API Key și Secret Key pentru Binance nu sunt setate în variabilele de mediu.")
+        _client = BinanceClient(BINANCE_API_KEY, BINANCE_SECRET_KEY)
+    return _client
 
 # Funcție pentru obținerea pozițiilor
 def get_positions():
-    params = {
-        'timestamp': int(time.time() * 1000),
-        'recvWindow': 5000
-    }
-    signed_params = sign_request(params)
-    url = f"{BASE_URL}{ENDPOINT_POSITIONS}?{signed_params}"
-    headers = {
-        'X-MBX-APIKEY': BINANCE_API_KEY
-    }
-    response = requests.get(url, headers=headers)
-    return response.json()
-
-# Funcție pentru obținerea prețurilor curente
+    return get_client().positions()
+
+# Funcție pentru obținerea prețurilor curente (un singur request, din cache dacă e recent)
 def get_current_prices(symbols):
-    prices = {}
-    for symbol in symbols:
-        endpoint = f"/fapi/v1/ticker/price?symbol={symbol}"
-        url = f"{BASE_URL}{endpoint}"
-        response = requests.get(url)
-        data = response.json()
-        prices[symbol] = float(data['price'])
-    return prices
+    all_prices = get_client().ticker_prices()
+    return {symbol: all_prices[symbol] for symbol in symbols if symbol in all_prices}
 
 # Funcție pentru calcularea riscurilor
 def calculate_risk(positions, prices):
@@ -113,9 +91,14 @@ def main():
         # Calculăm riscurile
         results = calculate_risk(positions, prices)
 
+        # Istoricul local alimentează volatilitatea din simularea Monte Carlo
+        history = update_history(load_history(), results)
+        save_history(history)
+        add_liquidation_probabilities(results, history)
+
         # Salvăm rezultatele în binance-status.json
         with open('binance-status.json', 'w') as f:
-            json.dump({'positions': results}, f, indent=2)
+            json.dump({'positions': results, 'liquidation_horizon_hours': HORIZON_HOURS}, f, indent=2)
 
         print("Fișierul binance-status.json a fost generat cu succes.")
 
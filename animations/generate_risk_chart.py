@@ -1,5 +1,8 @@
 import matplotlib.pyplot as plt
 import json
+import numpy as np
+
+from stress_test import stress_grid
 
 # Încarcă datele
 data = json.load(open('binance-status.json'))
@@ -21,4 +24,30 @@ for bar, risk in zip(bars, risks):
 
 # Salvează graficul
 plt.savefig('risk_chart.png')
-print('Grafic salvat ca risk_chart.png')
\ No newline at end of file
+print('Grafic salvat ca risk_chart.png')
+
+# Heatmap stress test: riscul fiecărei poziții pe grila de șocuri (-50%..+50%)
+grid = stress_grid(data['positions'])
+shocks = grid['shocks'] * 100
+
+plt.figure(figsize=(12, max(3, 0.5 * len(symbols) + 2)))
+plt.imshow(
+    np.clip(grid['risk'].T * 100, -50, 50),
+    aspect='auto',
+    cmap='RdYlGn',
+    vmin=-50,
+    vmax=50,
+    extent=[shocks[0], shocks[-1], len(symbols) - 0.5, -0.5]
+)
+plt.colorbar(label='Risc după șoc (%)')
+
+# Marcăm cu X pozițiile lichidate la fiecare nivel de șoc
+shock_idx, pos_idx = np.nonzero(grid['liquidated'])
+plt.scatter(shocks[shock_idx], pos_idx, marker='x', color='black', s=8)
+
+plt.yticks(range(len(symbols)), symbols)
+plt.xlabel('Șoc de preț (%)')
+plt.title('Stress Test Lichidări (Binance Futures)')
+plt.tight_layout()
+plt.savefig('stress_heatmap.png')
+print('Heatmap salvat ca stress_heatmap.png')
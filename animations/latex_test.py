@@ -3,7 +3,9 @@ LaTeX Test - Verificare rendering matematic
 """
 from manim import *
 
-class LatexTest(Scene):
+from tex_batch import TexPrepassMixin
+
+class LatexTest(TexPrepassMixin, Scene):
     def construct(self):
         # Titlu
         title = Text("LaTeX Test", font_size=48)
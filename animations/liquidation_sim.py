@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# Simulator Monte Carlo pentru probabilitatea de lichidare a pozițiilor.
+# Prețul fiecărui simbol urmează o mișcare browniană geometrică (log-preț fără
+# drift), cu volatilitatea estimată din istoricul local (risk-history.json).
+#
+# Toate pozițiile folosesc aceleași traiectorii browniene standard pe [0, 1]:
+# o poziție cu volatilitatea sigma (pe oră) și orizontul T (ore) este lichidată
+# dacă minimul (LONG) sau maximul (SHORT) traiectoriei atinge pragul
+# ln(lichidare / preț) / (sigma * sqrt(T)). Extremele traiectoriilor se
+# simulează o singură dată, în bucăți (memorie limitată), apoi fiecare poziție
+# costă un singur searchsorted: 10^5 traiectorii x sute de poziții < 1 s.
+
+import json
+import math
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+HISTORY_FILE = 'risk-history.json'
+STATUS_FILE = 'binance-status.json'
+
+MAX_HISTORY = 500               # eșantioane păstrate per simbol
+MIN_SAMPLES = 10                # sub atât folosim volatilitatea implicită
+DEFAULT_HOURLY_VOLATILITY = 0.01
+
+HORIZON_HOURS = 24
+N_PATHS = 100_000
+N_STEPS = 96
+CHUNK_PATHS = 8192
+
+# Corecția Broadie-Glasserman-Kou: monitorizarea discretă (N_STEPS puncte)
+# ratează atingerile dintre pași, așa că apropiem pragul cu beta * sqrt(dt)
+BGK_BETA = 0.5826
+
+
+# Funcție pentru formatarea timpului ca în alert-cache.json
+def iso_now():
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def parse_time(value):
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+
+# Funcție pentru citirea istoricului local de prețuri și riscuri
+def load_history(path=HISTORY_FILE):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_history(history, path=HISTORY_FILE):
+    with open(path, 'w') as f:
+        json.dump(history, f, indent=2)
+
+
+# Funcție pentru adăugarea pozițiilor curente în istoric
+def update_history(history, results, now=None):
+    now = now or iso_now()
+    for pos in results:
+        samples = history.setdefault(pos['symbol'], [])
+        samples.append({'time': now, 'price': pos['current_price'], 'risk': pos['risk']})
+        del samples[:-MAX_HISTORY]
+    return history
+
+
+# Funcție pentru estimarea volatilității pe oră din istoric
+def estimate_volatility(samples):
+    if len(samples) <= MIN_SAMPLES:
+        return DEFAULT_HOURLY_VOLATILITY
+
+    times = np.array([parse_time(s['time']) for s in samples])
+    prices = np.array([s['price'] for s in samples], dtype=float)
+    hours = np.diff(times) / 3600
+    returns = np.diff(np.log(prices))
+
+    # Randamente normalizate la o oră: r / sqrt(dt), media pătratelor = sigma^2
+    valid = hours > 0
+    if valid.sum() < MIN_SAMPLES:
+        return DEFAULT_HOURLY_VOLATILITY
+    sigma = math.sqrt(np.mean(returns[valid] ** 2 / hours[valid]))
+    return sigma if sigma > 0 else DEFAULT_HOURLY_VOLATILITY
+
+
+def estimate_volatilities(history, symbols):
+    return {symbol: estimate_volatility(history.get(symbol, [])) for symbol in symbols}
+
+
+# Funcție pentru simularea extremelor traiectoriilor browniene standard
+def simulate_extremes(n_paths=N_PATHS, n_steps=N_STEPS, chunk=CHUNK_PATHS, seed=None):
+    rng = np.random.default_rng(seed)
+    minima = np.empty(n_paths)
+    maxima = np.empty(n_paths)
+    scale = math.sqrt(1 / n_steps)
+
+    for start in range(0, n_paths, chunk):
+        size = min(chunk, n_paths - start)
+        paths = np.cumsum(rng.standard_normal((size, n_steps)) * scale, axis=1)
+        # Traiectoria pornește din 0, deci extremele includ și punctul inițial
+        minima[start:start + size] = np.minimum(paths.min(axis=1), 0)
+        maxima[start:start + size] = np.maximum(paths.max(axis=1), 0)
+
+    minima.sort()
+    maxima.sort()
+    return minima, maxima
+
+
+# Funcție pentru calcularea probabilităților de lichidare (vectorizat pe poziții)
+def liquidation_probabilities(results, volatilities, horizon_hours=HORIZON_HOURS,
+                              n_paths=N_PATHS, n_steps=N_STEPS, seed=None, extremes=None):
+    if not results:
+        return np.zeros(0)
+
+    price = np.array([pos['current_price'] for pos in results], dtype=float)
+    liquidation = np.array([pos['liquidation_price'] for pos in results], dtype=float)
+    sigma = np.array([volatilities[pos['symbol']] for pos in results], dtype=float)
+    is_long = np.array([pos['side'] == 'LONG' for pos in results])
+
+    minima, maxima = extremes if extremes is not None else simulate_extremes(n_paths, n_steps, seed=seed)
+    n_paths = len(minima)
+
+    # Prețul de lichidare 0 înseamnă că poziția nu poate fi lichidată
+    has_liquidation = liquidation > 0
+    barrier = np.log(np.where(has_liquidation, liquidation, 1.0) / price) / (sigma * math.sqrt(horizon_hours))
+    shift = BGK_BETA * math.sqrt(1 / n_steps)
+
+    long_hits = np.searchsorted(minima, barrier + shift, side='right')
+    short_hits = n_paths - np.searchsorted(maxima, barrier - shift, side='left')
+    probability = np.where(is_long, long_hits, short_hits) / n_paths
+
+    # Deja dincolo de prețul de lichidare
+    crossed = np.where(is_long, barrier >= 0, barrier <= 0)
+    probability = np.where(crossed, 1.0, probability)
+    return np.where(has_liquidation, probability, 0.0)
+
+
+# Funcție pentru adăugarea probabilităților în rezultatele calculate
+def add_liquidation_probabilities(results, history, horizon_hours=HORIZON_HOURS, seed=None):
+    volatilities = estimate_volatilities(history, {pos['symbol'] for pos in results})
+    probabilities = liquidation_probabilities(results, volatilities, horizon_hours, seed=seed)
+    for pos, probability in zip(results, probabilities):
+        pos['volatility_1h'] = volatilities[pos['symbol']]
+        pos['liquidation_probability'] = float(probability)
+    return results
+
+
+# Funcție principală: recalculează probabilitățile pentru binance-status.json
+def main():
+    horizon = float(sys.argv[1]) if len(sys.argv) > 1 else HORIZON_HOURS
+    with open(STATUS_FILE, 'r') as f:
+        status = json.load(f)
+
+    start = time.perf_counter()
+    results = add_liquidation_probabilities(status['positions'], load_history(), horizon)
+    elapsed = time.perf_counter() - start
+
+    status['liquidation_horizon_hours'] = horizon
+    with open(STATUS_FILE, 'w') as f:
+        json.dump(status, f, indent=2)
+
+    for pos in results:
+        print(f"{pos['symbol']}: probabilitate lichidare {pos['liquidation_probability']:.2%} în {horizon:g}h")
+    print(f"Simulare {N_PATHS:,} traiectorii x {len(results)} poziții în {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+MathCLI Pro - Level-of-Detail Number Line
+A number line that shows a window [view_min, view_max] of the real line and
+regenerates its ticks and labels for that window only.
+
+manim's NumberLine builds one tick (and with numbers, one label) per step of
+its whole range, so it stops being usable past a few hundred steps. Here
+the tick and label steps are picked from the 1-2-5 sequence to fit the
+current window, all ticks are one VMobject whose points are set in a single
+numpy operation, and labels are cached by value, so zooming from [0, 30] to
+[0, 10^9] keeps a constant number of mobjects per frame and only lays out
+text for values it has not shown before.
+
+Zooming is done in value space (zoom_to), which stays exact far beyond the
+range where scene coordinates would lose precision.
+"""
+
+import math
+from collections import OrderedDict
+
+import numpy as np
+from manim import DOWN, LEFT, RIGHT, UP, WHITE, Animation, Line, Text, VGroup, VMobject
+
+# Labelled values kept around for reuse
+LABEL_CACHE_SIZE = 256
+
+
+def nice_step(raw, minimum=0):
+    """Smallest step of the form {1, 2, 5} x 10^k that is >= raw"""
+    raw = max(raw, minimum, 1e-12)
+    power = 10.0 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if factor * power >= raw * (1 - 1e-9):
+            return max(factor * power, minimum)
+
+
+def format_value(value, step):
+    """Thousands-separated integer, or as many decimals as the step needs"""
+    if step >= 1:
+        return f"{int(round(value)):,}"
+    decimals = max(0, -math.floor(math.log10(step)))
+    return f"{value:,.{decimals}f}"
+
+
+class LODNumberLine(VGroup):
+    """
+    Number line with ticks and labels generated for the visible interval
+    Usage: line = LODNumberLine(0, 30); self.play(line.zoom_to(0, 10**9))
+    """
+
+    def __init__(self, view_min=0, view_max=10, length=12, max_ticks=60, max_labels=12,
+                 min_tick_step=1, tick_size=0.2, font_size=16, label_buff=0.4,
+                 color=WHITE, stroke_width=2, **kwargs):
+        super().__init__(**kwargs)
+        self.max_ticks = max_ticks
+        self.max_labels = max_labels
+        self.min_tick_step = min_tick_step
+        self.tick_size = tick_size
+        self.font_size = font_size
+        self.label_buff = label_buff
+        self.label_cache = OrderedDict()
+
+        self.axis = Line(LEFT * length / 2, RIGHT * length / 2, color=color, stroke_width=stroke_width)
+        self.ticks = VMobject(stroke_color=color, stroke_width=stroke_width)
+        self.labels = VGroup()
+        self.add(self.axis, self.ticks, self.labels)
+        self.set_view(view_min, view_max)
+
+    def number_to_point(self, value):
+        start, end = self.axis.get_start(), self.axis.get_end()
+        alpha = (value - self.view_min) / (self.view_max - self.view_min)
+        return start + alpha * (end - start)
+
+    def set_view(self, view_min, view_max):
+        """Show [view_min, view_max] and rebuild ticks and labels for it"""
+        self.view_min, self.view_max = float(view_min), float(view_max)
+        width = self.view_max - self.view_min
+
+        labels, label_step = [], None
+        if self.max_labels:
+            label_step = nice_step(width / self.max_labels, self.min_tick_step)
+            labels = self.place_labels(label_step)
+            # Widen the step until neighbouring labels no longer overlap
+            spacing = self.axis.get_length() * label_step / width
+            while len(labels) > 1 and max(label.width for label in labels) * 1.2 > spacing:
+                label_step = nice_step(label_step * 1.5)
+                labels = self.place_labels(label_step)
+                spacing = self.axis.get_length() * label_step / width
+
+        tick_step = nice_step(width / self.max_ticks, self.min_tick_step)
+        if label_step:
+            # Every label sits on a tick (a 2 tick step cannot carry 5 labels)
+            tick_step = min(tick_step, label_step)
+            while not math.isclose(label_step / tick_step, round(label_step / tick_step)):
+                tick_step = nice_step(tick_step * 1.01)
+        self.set_ticks(self.values_in_view(tick_step))
+        self.labels.submobjects = labels
+        return self
+
+    def values_in_view(self, step):
+        first = math.ceil(self.view_min / step)
+        last = math.floor(self.view_max / step)
+        return np.arange(first, last + 1) * step
+
+    def set_ticks(self, values):
+        """All ticks as one VMobject: one straight cubic segment per tick"""
+        if len(values) == 0:
+            self.ticks.set_points(np.zeros((0, 3)))
+            return
+        centers = np.array([self.number_to_point(v) for v in values[[0, -1]]])
+        # number_to_point is affine: interpolate the rest in one step
+        alphas = (values - values[0]) / max(values[-1] - values[0], 1e-12)
+        centers = centers[0] + alphas[:, None] * (centers[1] - centers[0])
+        half = UP * self.tick_size / 2
+        segment = np.linspace(-1, 1, 4)[:, None] * half
+        self.ticks.set_points((centers[:, None, :] + segment[None, :, :]).reshape(-1, 3))
+
+    def label_for(self, text):
+        label = self.label_cache.get(text)
+        if label is None:
+            label = Text(text, font_size=self.font_size)
+            self.label_cache[text] = label
+            if len(self.label_cache) > LABEL_CACHE_SIZE:
+                self.label_cache.popitem(last=False)
+        else:
+            self.label_cache.move_to_end(text)
+        return label
+
+    def place_labels(self, step):
+        labels = []
+        for value in self.values_in_view(step):
+            label = self.label_for(format_value(value, step))
+            label.move_to(self.number_to_point(value) + DOWN * self.label_buff)
+            labels.append(label)
+        return labels
+
+    def zoom_to(self, view_min, view_max, **kwargs):
+        return ZoomView(self, view_min, view_max, **kwargs)
+
+
+class ZoomView(Animation):
+    """
+    Animate the visible interval of an LODNumberLine, with the width changing
+    geometrically so a zoom over several orders of magnitude has a steady pace
+    """
+
+    def __init__(self, line, view_min, view_max, **kwargs):
+        super().__init__(line, **kwargs)
+        self.end_view = (float(view_min), float(view_max))
+
+    def create_starting_mobject(self):
+        # The line is rebuilt from the interval alone: no copy needed
+        return self.mobject
+
+    def begin(self):
+        self.start_view = (self.mobject.view_min, self.mobject.view_max)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        (start_min, start_max), (end_min, end_max) = self.start_view, self.end_view
+        start_width, end_width = start_max - start_min, end_max - end_min
+        width = start_width * (end_width / start_width) ** alpha
+        # The center arrives in step with the width
+        progress = alpha if start_width == end_width else (start_width - width) / (start_width - end_width)
+        center = (start_min + start_max) / 2 + ((end_min + end_max) - (start_min + start_max)) / 2 * progress
+        self.mobject.set_view(center - width / 2, center + width / 2)
@@ -0,0 +1,146 @@
+"""
+MathCLI Pro - Memory Budget Guard
+Keeps a scene's mobjects within a memory budget, so raising n_max or
+grid_size degrades the picture or fails at once with an estimate, instead
+of swapping halfway through a long render.
+
+Every mobject added to the scene is measured once (numpy arrays of its
+family plus a fixed per-object overhead). Groups built but not added yet
+are held as pending (hold()), so a scene building several large groups
+before playing any of them sees them all in the estimate. Scenes ask for
+large homogeneous groups through the mixin before building them:
+- dot_group() returns Dots while the projected total fits, and a single
+  PMobject point cloud (points and colors only) when it does not;
+- fits_or_degrade() picks between any full and compact form, e.g. a grid
+  with or without its digit labels.
+The switch is logged with manim's logger, and MemoryError is raised with
+the estimate (reserve()) when even the compact form does not fit.
+
+Budget: SCENE_MEMORY_BUDGET_MB, or half of the physical memory.
+"""
+
+import os
+import weakref
+
+import numpy as np
+from manim import Dot, PMobject, VGroup, config, logger
+
+# Python object, attribute dict and bookkeeping of one mobject, besides its arrays
+MOBJECT_OVERHEAD = 3000
+
+# Arrays counted for each family member
+ARRAY_ATTRS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "rgbas", "pixel_array")
+
+
+def default_budget():
+    """Budget in bytes"""
+    megabytes = os.getenv("SCENE_MEMORY_BUDGET_MB")
+    if megabytes:
+        return int(float(megabytes) * 2**20)
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // 2
+    except (ValueError, OSError, AttributeError):
+        return 4 * 2**30
+
+
+def mobject_bytes(mobject):
+    """Estimated memory of a mobject and its whole family"""
+    total = 0
+    for member in mobject.get_family():
+        total += MOBJECT_OVERHEAD
+        for attr in ARRAY_ATTRS:
+            array = getattr(member, attr, None)
+            if isinstance(array, np.ndarray):
+                total += array.nbytes
+    return total
+
+
+def format_mb(n_bytes):
+    return f"{n_bytes / 2**20:,.0f} MB"
+
+
+class MemoryBudgetMixin:
+    """
+    Scene mixin tracking estimated mobject memory against a budget
+    Usage: class UlamSpiral(ParametrizedScene, MemoryBudgetMixin, MovingCameraScene)
+    """
+
+    # Bytes; None uses default_budget()
+    MEMORY_BUDGET = None
+
+    def __init__(self, *args, **kwargs):
+        self.memory_budget = self.MEMORY_BUDGET or default_budget()
+        self.mobject_sizes = weakref.WeakKeyDictionary()
+        # Built but not added yet: mobject -> bytes
+        self.pending_sizes = weakref.WeakKeyDictionary()
+        super().__init__(*args, **kwargs)
+
+    def estimated_bytes(self):
+        """Estimated memory of the mobjects in the scene and of the pending ones"""
+        in_scene = sum(self.mobject_sizes.get(m, 0) for m in self.mobjects)
+        return in_scene + sum(self.pending_sizes.values())
+
+    def hold(self, mobject, n_bytes=None):
+        """Count a built mobject against the budget until it is added"""
+        size = mobject_bytes(mobject) if n_bytes is None else n_bytes
+        self.mobject_sizes[mobject] = size
+        self.pending_sizes[mobject] = size
+        return mobject
+
+    def reserve(self, n_bytes, what):
+        """Fail fast if n_bytes more would not fit the budget"""
+        projected = self.estimated_bytes() + n_bytes
+        if projected > self.memory_budget:
+            raise MemoryError(
+                f"{type(self).__name__}: {what} needs ~{format_mb(n_bytes)}, bringing the scene to "
+                f"~{format_mb(projected)} over its {format_mb(self.memory_budget)} budget "
+                f"(set SCENE_MEMORY_BUDGET_MB or lower the scene parameters)"
+            )
+        return projected
+
+    def fits(self, n_bytes):
+        return self.estimated_bytes() + n_bytes <= self.memory_budget
+
+    def add(self, *mobjects):
+        for mobject in mobjects:
+            # Already counted as pending
+            self.pending_sizes.pop(mobject, None)
+        new = [m for m in mobjects if m not in self.mobject_sizes]
+        if new:
+            sizes = [mobject_bytes(m) for m in new]
+            self.reserve(sum(sizes), f"adding {', '.join(type(m).__name__ for m in new)}")
+            for mobject, size in zip(new, sizes):
+                self.mobject_sizes[mobject] = size
+        return super().add(*mobjects)
+
+    def fits_or_degrade(self, full_bytes, compact_bytes, what, compact):
+        """
+        True when the full representation fits; otherwise check the compact
+        one against the budget and log the switch
+        """
+        if self.fits(full_bytes):
+            return True
+        self.reserve(compact_bytes, f"{what} as {compact}")
+        logger.warning(
+            "%s: %s would take ~%s (budget %s), using %s instead (~%s)",
+            type(self).__name__, what, format_mb(full_bytes),
+            format_mb(self.memory_budget), compact, format_mb(compact_bytes),
+        )
+        return False
+
+    def dot_group(self, points, radius, color, what="dots"):
+        """
+        Dots at the given points, or one PMobject cloud when that many Dots
+        would not fit the budget; held as pending until added
+        """
+        sample = Dot(radius=radius, color=color)
+        dots_bytes = len(points) * mobject_bytes(sample)
+        # 3 coordinates + 4 color channels per point
+        cloud_bytes = len(points) * 7 * 8 + MOBJECT_OVERHEAD
+        if self.fits_or_degrade(dots_bytes, cloud_bytes, f"{len(points):,} {what}", "one point cloud"):
+            return self.hold(VGroup(*[sample.copy().move_to(point) for point in points]), dots_bytes)
+
+        thickness = max(1, round(2 * radius * config.pixel_width / config.frame_width))
+        cloud = PMobject(stroke_width=thickness)
+        cloud.add_points(np.asarray(points, dtype=float), color=color)
+        return self.hold(cloud, cloud_bytes)
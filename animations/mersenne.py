@@ -0,0 +1,147 @@
+"""
+MathCLI Pro - Mersenne Primes & Perfect Numbers
+Finds even perfect numbers 2^(p-1) * (2^p - 1) by testing Mersenne numbers
+with Lucas-Lehmer, and describes huge ones without building their decimal
+string (digit count, leading and trailing digits).
+
+- Lucas-Lehmer squares modulo M = 2^p - 1 using shift-and-add reduction
+  (x mod M = (x & M) + (x >> p)), no big-int division.
+- Candidates are pre-filtered by trial factors q = 2kp + 1 with
+  q = +-1 (mod 8), then fanned out over a process pool in order.
+- gmpy2 is used for the big-int squaring when installed (optional).
+
+Run:
+    python mersenne.py 20          # first 20 perfect numbers (p up to 4423)
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal, localcontext
+
+from number_theory import primes_up_to
+
+try:
+    from gmpy2 import mpz
+except ImportError:
+    mpz = int
+
+TRIAL_FACTOR_LIMIT = 1 << 16
+BLOCK_SIZE = 64
+
+
+def has_small_factor(p, limit=TRIAL_FACTOR_LIMIT):
+    """True if 2^p - 1 has a factor q = 2kp + 1 below `limit`"""
+    q = 2 * p + 1
+    while q < limit:
+        if q % 8 in (1, 7) and pow(2, p, q) == 1:
+            return q != (1 << p) - 1
+        q += 2 * p
+    return False
+
+
+def lucas_lehmer(p):
+    """True iff 2^p - 1 is prime (p must be prime)"""
+    if p == 2:
+        return True
+    if has_small_factor(p):
+        return False
+
+    m = mpz((1 << p) - 1)
+    s = mpz(4)
+    for _ in range(p - 2):
+        s = s * s - 2
+        # Shift-and-add reduction, twice brings s below 2M
+        s = (s & m) + (s >> p)
+        s = (s & m) + (s >> p)
+        if s >= m:
+            s -= m
+    return s == 0
+
+
+def _block_worker(block):
+    return [p for p in block if lucas_lehmer(p)]
+
+
+def mersenne_exponents(count=None, p_max=None, workers=None):
+    """
+    Yield exponents p with 2^p - 1 prime, in increasing order
+    Stops after `count` results or once p exceeds `p_max`
+    """
+    if count is None and p_max is None:
+        raise ValueError("Pass count or p_max, the search is unbounded otherwise")
+
+    workers = workers or os.cpu_count() or 1
+    found = 0
+    bound = p_max or 1024
+    start = 0
+
+    pool = ProcessPoolExecutor(workers) if workers > 1 else None
+    try:
+        while True:
+            candidates = [int(p) for p in primes_up_to(bound) if p > start]
+            blocks = [candidates[i:i + BLOCK_SIZE] for i in range(0, len(candidates), BLOCK_SIZE)]
+            results = pool.map(_block_worker, blocks) if pool else map(_block_worker, blocks)
+            for block_hits in results:
+                for p in block_hits:
+                    yield p
+                    found += 1
+                    if count is not None and found >= count:
+                        return
+            if p_max is not None:
+                return
+            start, bound = bound, bound * 2
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def perfect_number(p):
+    """The even perfect number for a Mersenne exponent p (materialized)"""
+    return (1 << (p - 1)) * ((1 << p) - 1)
+
+
+def perfect_number_summary(p, lead=10, trail=10):
+    """
+    Digit count, leading and trailing digits of 2^(p-1) * (2^p - 1)
+    computed from logarithms and modular powers only
+    """
+    if p < 64:
+        # Small enough to print exactly (and log rounding can't bite)
+        text = str(perfect_number(p))
+        return {"p": p, "digits": len(text), "leading": text[:lead], "trailing": text[-trail:]}
+
+    modulus = 10 ** trail
+    trailing = pow(2, p - 1, modulus) * (pow(2, p, modulus) - 1) % modulus
+
+    with localcontext() as ctx:
+        ctx.prec = len(str(p)) + lead + 30
+        log10_2 = Decimal(2).ln() / Decimal(10).ln()
+        # log10(2^(p-1) * (2^p - 1)) = (2p - 1) log10 2 + log10(1 - 2^-p)
+        log_value = (2 * p - 1) * log10_2
+        log_value += (1 - Decimal(2) ** -p).ln() / Decimal(10).ln()
+        digits = int(log_value) + 1
+        fraction = log_value - int(log_value)
+        leading = int(Decimal(10) ** (fraction + lead - 1))
+
+    return {
+        "p": p,
+        "digits": digits,
+        "leading": str(leading),
+        "trailing": str(trailing).zfill(trail),
+    }
+
+
+def format_perfect_number(p, max_digits=12, lead=6, trail=6):
+    """Short label: the full number when small, lead...trail otherwise"""
+    info = perfect_number_summary(p, lead, trail)
+    if info["digits"] <= max_digits:
+        return f"{perfect_number(p):,}"
+    return f"{info['leading']}…{info['trailing']} ({info['digits']:,} digits)"
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    for i, p in enumerate(mersenne_exponents(count=count), 1):
+        info = perfect_number_summary(p)
+        print(f"#{i:>2}  p = {p:<6} {info['digits']:>8,} digits  {info['leading']}…{info['trailing']}")
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# Fan-out pentru mai multe conturi (sub-conturi) Binance Futures.
+# Pozițiile și balanțele tuturor conturilor se citesc concurent cu asyncio,
+# peste pool-ul comun de conexiuni din binance_client, cu o limită de request-uri
+# simultane per cont (un semafor prin care trec toate request-urile contului).
+# Prețurile se citesc o singură dată pentru toate conturile. Rezultatele se combină într-un singur binance-status.json
+# (risc per cont + total), deci o reîmprospătare completă durează cât cel mai
+# lent cont, nu suma tuturor.
+#
+# accounts.json:
+#   [{"name": "main", "key_env": "BINANCE_API_KEY", "secret_env": "BINANCE_SECRET_KEY",
+#     "max_concurrent": 2}, ...]
+# Cheile rămân în variabile de mediu, fișierul conține doar numele lor.
+# max_concurrent e opțional (implicit PER_ACCOUNT_LIMIT).
+
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from requests import RequestException
+from requests.adapters import HTTPAdapter
+
+from binance_client import BinanceAPIError, BinanceClient, shared_session
+from generate_binance_status import calculate_risk
+from liquidation_sim import (
+    HORIZON_HOURS, add_liquidation_probabilities, load_history, save_history, update_history
+)
+
+ACCOUNTS_FILE = 'accounts.json'
+STATUS_FILE = 'binance-status.json'
+
+PER_ACCOUNT_LIMIT = 2       # request-uri simultane per cont (implicit)
+POOL_SIZE = 32              # conexiuni HTTP / thread-uri comune
+
+
+# Funcție pentru citirea conturilor (implicit: contul din variabilele de mediu)
+def load_accounts(path=ACCOUNTS_FILE):
+    try:
+        with open(path, 'r') as f:
+            entries = json.load(f)
+    except FileNotFoundError:
+        entries = [{"name": "main", "key_env": "BINANCE_API_KEY", "secret_env": "BINANCE_SECRET_KEY"}]
+
+    accounts = []
+    for entry in entries:
+        api_key = os.getenv(entry['key_env'])
+        api_secret = os.getenv(entry['secret_env'])
+        if not api_key or not api_secret:
+            raise ValueError(f"Cheile pentru contul {entry['name']} nu sunt setate ({entry['key_env']}, {entry['secret_env']}).")
+        limit = int(entry.get('max_concurrent', PER_ACCOUNT_LIMIT))
+        accounts.append((entry['name'], BinanceClient(api_key, api_secret), limit))
+    return accounts
+
+
+# Funcție pentru mărirea pool-ului de conexiuni comun
+def configure_pool(size=POOL_SIZE):
+    adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+    shared_session.mount('https://', adapter)
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=size))
+
+
+# Funcție pentru un request al unui cont, prin semaforul contului
+async def call(limit, method):
+    async with limit:
+        return await asyncio.to_thread(method)
+
+
+# Funcție pentru un cont: poziții și balanțe în paralel, limitate de semafor
+async def fetch_account(name, client, limit):
+    positions, account = await asyncio.gather(call(limit, client.positions), call(limit, client.account))
+
+    return {
+        'name': name,
+        'open_positions': [pos for pos in positions if float(pos['positionAmt']) != 0],
+        'balances': [
+            {'asset': asset['asset'], 'wallet_balance': float(asset['walletBalance'])}
+            for asset in account['assets']
+            if float(asset['walletBalance']) != 0
+        ],
+        'wallet_balance': float(account['totalWalletBalance']),
+        'unrealized_pnl': float(account['totalUnrealizedProfit']),
+        'margin_balance': float(account['totalMarginBalance']),
+    }
+
+
+# Funcție pentru sumarul de risc al unei liste de poziții
+def risk_summary(positions):
+    risks = [pos['risk'] for pos in positions]
+    return {
+        'positions': len(positions),
+        'min_risk': min(risks) if risks else None,
+        'notional': sum(abs(pos['quantity']) * pos['current_price'] for pos in positions),
+        'max_liquidation_probability': max(
+            (pos.get('liquidation_probability', 0) for pos in positions), default=0
+        ),
+    }
+
+
+# Funcție pentru toate conturile: fan-out, apoi agregare
+async def fetch_all(accounts):
+    configure_pool()
+    # Un semafor per cont, comun tuturor request-urilor contului
+    limits = {name: asyncio.Semaphore(limit) for name, _, limit in accounts}
+
+    # Prețurile sunt comune tuturor conturilor: un singur request (cache TTL),
+    # prin primul cont, în paralel cu conturile. Fără prețuri nu se poate
+    # calcula niciun risc.
+    first_name, first_client, _ = accounts[0]
+    prices_task = asyncio.create_task(call(limits[first_name], first_client.ticker_prices))
+    outcomes = await asyncio.gather(
+        *(fetch_account(name, client, limits[name]) for name, client, _ in accounts),
+        return_exceptions=True
+    )
+    prices = await prices_task
+
+    per_account = {}
+    all_positions = []
+    errors = {}
+    for (name, _, _), outcome in zip(accounts, outcomes):
+        if isinstance(outcome, Exception):
+            errors[name] = str(outcome)
+            continue
+        outcome['positions'] = calculate_risk(outcome.pop('open_positions'), prices)
+        for pos in outcome['positions']:
+            pos['account'] = name
+        per_account[name] = outcome
+        all_positions.extend(outcome['positions'])
+
+    # Probabilitățile de lichidare se calculează o singură dată pentru toată cartea
+    history = update_history(load_history(), all_positions)
+    save_history(history)
+    add_liquidation_probabilities(all_positions, history)
+
+    for account in per_account.values():
+        account['risk'] = risk_summary(account['positions'])
+
+    totals = risk_summary(all_positions)
+    for key in ('wallet_balance', 'unrealized_pnl', 'margin_balance'):
+        totals[key] = sum(account[key] for account in per_account.values())
+
+    return {
+        'positions': all_positions,
+        'accounts': per_account,
+        'totals': totals,
+        'errors': errors,
+        'liquidation_horizon_hours': HORIZON_HOURS,
+    }
+
+
+# Funcție principală
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else ACCOUNTS_FILE
+    accounts = load_accounts(path)
+    if not accounts:
+        sys.exit(f"Niciun cont configurat în {path}.")
+
+    start = time.perf_counter()
+    try:
+        status = asyncio.run(fetch_all(accounts))
+    except (BinanceAPIError, RequestException) as e:
+        # Doar request-ul de prețuri ajunge aici, erorile per cont sunt în status['errors']
+        sys.exit(f"Eroare la citirea prețurilor: {e}")
+    elapsed = time.perf_counter() - start
+
+    with open(STATUS_FILE, 'w') as f:
+        json.dump(status, f, indent=2)
+
+    for name, account in status['accounts'].items():
+        risk = account['risk']
+        min_risk = f"{risk['min_risk']:.2%}" if risk['min_risk'] is not None else '-'
+        print(f"{name}: {risk['positions']} poziții | risc minim {min_risk} | marjă {account['margin_balance']:,.2f} USDT")
+    for name, error in status['errors'].items():
+        print(f"{name}: Eroare: {error}")
+    print(f"{len(accounts)} conturi actualizate în {elapsed:.2f}s, salvat în {STATUS_FILE}")
+
+
+if __name__ == "__main__":
+    main()
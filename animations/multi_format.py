@@ -0,0 +1,149 @@
+"""
+MathCLI Pro - Multi-Format Export
+One render pass per scene, exported as 16:9, 9:16 and 1:1 videos.
+
+The scene is rendered once on a "superset" canvas: the union of the
+centered crops of every requested format, which for the scenes' 16:9
+layout is the landscape frame itself, at the resolution the sharpest crop
+needs. The vertical and square videos are centered 9:16 and 1:1 windows
+of that frame (no letterboxing), so at 1080x1920 the canvas is 3414x1920.
+--max-height trades their sharpness for render time: at 1080 the render
+costs one 1080p frame and the narrow crops are upscaled.
+A single ffmpeg filter graph then splits, crops and scales every format.
+
+Run:
+    python multi_format.py numerology_v3 PerfectNumbers
+    python multi_format.py numerology_v2 --formats vertical,square --fps 30
+    python multi_format.py numerology_v2 --max-height 1080
+"""
+
+import argparse
+import shutil
+import subprocess
+from pathlib import Path
+
+from manim import config, tempconfig
+
+from scene_catalog import SCENE_MODULES, find_scenes
+
+# name: (pixel_width, pixel_height)
+FORMATS = {
+    "landscape": (1920, 1080),
+    "vertical": (1080, 1920),
+    "square": (1080, 1080),
+}
+
+EXPORT_DIR = Path("media") / "videos" / "formats"
+
+
+def even(value):
+    """Encoders want even dimensions"""
+    return int(round(value / 2.0)) * 2
+
+
+def superset_canvas(formats, max_height=None):
+    """
+    Pixel size of the union of the formats' centered crops of the frame,
+    high enough that every crop has at least its output resolution
+    (capped at max_height rows)
+    """
+    aspect = max([config.frame_width / config.frame_height] + [w / h for w, h in formats.values()])
+    # Formats narrower than the canvas span its full height, wider ones its full width
+    height = max(h if w / h <= aspect else w / aspect for w, h in formats.values())
+    if max_height:
+        height = min(height, max_height)
+    return even(height * aspect), even(height)
+
+
+def crop_box(canvas, size):
+    """Largest centered crop of the canvas with the aspect ratio of one format"""
+    canvas_w, canvas_h = canvas
+    w, h = size
+    if w / h <= canvas_w / canvas_h:
+        crop_w, crop_h = min(canvas_w, even(canvas_h * w / h)), canvas_h
+    else:
+        crop_w, crop_h = canvas_w, min(canvas_h, even(canvas_w * h / w))
+    return crop_w, crop_h, (canvas_w - crop_w) // 2, (canvas_h - crop_h) // 2
+
+
+def build_filter_graph(canvas, formats):
+    """ffmpeg -filter_complex string producing one labelled output per format"""
+    names = list(formats)
+    graph = ["[0:v]split={}{}".format(len(names), "".join(f"[s{i}]" for i in range(len(names))))]
+    for i, name in enumerate(names):
+        crop_w, crop_h, x, y = crop_box(canvas, formats[name])
+        w, h = formats[name]
+        graph.append(f"[s{i}]crop={crop_w}:{crop_h}:{x}:{y},scale={w}:{h}[{name}]")
+    return ";".join(graph)
+
+
+def render_superset(scene_cls, canvas, fps):
+    """Render the scene once on the superset canvas, returns the movie path"""
+    canvas_w, canvas_h = canvas
+    options = {
+        "pixel_width": canvas_w,
+        "pixel_height": canvas_h,
+        "frame_rate": fps,
+        # Same frame aspect as the canvas: only the resolution changes
+        "frame_height": config.frame_width * canvas_h / canvas_w,
+        "output_file": f"{scene_cls.__name__}_superset",
+        "preview": False,
+    }
+    with tempconfig(options):
+        scene = scene_cls()
+        scene.render()
+        return Path(scene.renderer.file_writer.movie_file_path)
+
+
+def export_formats(movie_path, canvas, formats, out_dir, scene_name):
+    """Split the superset movie into every format with one ffmpeg call"""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg was not found on PATH (needed for format export)")
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    command = [
+        ffmpeg, "-y", "-loglevel", "error",
+        "-i", str(movie_path),
+        "-filter_complex", build_filter_graph(canvas, formats),
+    ]
+    outputs = {}
+    for name in formats:
+        out_path = out_dir / f"{scene_name}_{name}.mp4"
+        command += [
+            "-map", f"[{name}]",
+            "-c:v", "libx264", "-preset", "medium", "-crf", "18",
+            "-pix_fmt", "yuv420p",
+            str(out_path),
+        ]
+        outputs[name] = out_path
+
+    subprocess.run(command, check=True)
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export scenes in several aspect ratios from one render")
+    parser.add_argument("module", nargs="?", help="scene module (default: all numerology modules)")
+    parser.add_argument("scenes", nargs="*", help="scene names (default: all in module)")
+    parser.add_argument("--formats", default=",".join(FORMATS), help="comma separated: " + ", ".join(FORMATS))
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--max-height", type=int, help="cap the render height (narrow crops are upscaled)")
+    args = parser.parse_args()
+
+    formats = {name: FORMATS[name] for name in args.formats.split(",")}
+    canvas = superset_canvas(formats, args.max_height)
+    modules = [args.module] if args.module else SCENE_MODULES
+
+    for module_name in modules:
+        for scene_name, scene_cls in find_scenes(module_name):
+            if args.scenes and scene_name not in args.scenes:
+                continue
+            movie_path = render_superset(scene_cls, canvas, args.fps)
+            outputs = export_formats(movie_path, canvas, formats, EXPORT_DIR / module_name, scene_name)
+            for name, path in outputs.items():
+                print(f"{module_name}.{scene_name} [{name}]: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+MathCLI Pro - Number Theory Helpers
+Shared by the numerology scenes: primes, divisors, spiral positions
+"""
+
+import numpy as np
+
+from sequence_store import get_store
+
+# Above this the shared on-disk sieve is used instead of sieving per process
+# (the shipped scenes sieve 100 to 100 000 numbers)
+STORE_THRESHOLD = 64
+
+
+def is_prime(n):
+    """Check if number is prime"""
+    if n < 2:
+        return False
+    if n < 4:
+        return True
+    if n % 2 == 0:
+        return False
+    for i in range(3, int(np.sqrt(n)) + 1, 2):
+        if n % i == 0:
+            return False
+    return True
+
+
+def prime_sieve(n):
+    """Boolean array where mask[k] is True iff k is prime, for 0 <= k <= n"""
+    if n > STORE_THRESHOLD:
+        return get_store().prime_mask(n)
+    mask = np.ones(n + 1, dtype=bool)
+    mask[:2] = False
+    for p in range(2, int(np.sqrt(n)) + 1):
+        if mask[p]:
+            mask[p * p::p] = False
+    return mask
+
+
+def primes_up_to(n):
+    """All primes <= n as an int array"""
+    if n > STORE_THRESHOLD:
+        return get_store().primes(n)
+    return np.flatnonzero(prime_sieve(n))
+
+
+def fibonacci(count):
+    """F(1)..F(count) (1, 1, 2, 3, ...) from the shared store, count <= 93"""
+    return [int(f) for f in get_store().fibonacci(count + 1)[1:]]
+
+
+def digital_roots(values):
+    """Digital roots of an integer array (1..9, 0 for 0)"""
+    values = np.asarray(values, dtype=np.int64)
+    return np.where(values == 0, 0, 1 + (values - 1) % 9)
+
+
+def proper_divisors(n):
+    """Divisors of n smaller than n, ascending"""
+    small, large = [], []
+    for d in range(1, int(np.sqrt(n)) + 1):
+        if n % d == 0:
+            small.append(d)
+            if d != n // d:
+                large.append(n // d)
+    return [d for d in small + large[::-1] if d != n]
+
+
+def ulam_coords(n):
+    """
+    Convert index to spiral coordinates (Ulam spiral)
+    Returns (x, y) position on the spiral
+    """
+    if n == 1:
+        return (0, 0)
+
+    # Find the ring number
+    k = int(np.ceil((np.sqrt(n) - 1) / 2))
+
+    # Find position in ring
+    t = 2 * k + 1
+    m = t ** 2
+    t = t - 1
+
+    if n >= m - t:
+        return (k - (m - n), -k)
+    m = m - t
+    if n >= m - t:
+        return (-k, -k + (m - n))
+    m = m - t
+    if n >= m - t:
+        return (-k + (m - n), k)
+    return (k, k - (m - n - t))
+
+
+def ulam_coords_array(n):
+    """Vectorized ulam_coords for an int array of indices >= 1, returns (x, y)"""
+    n = np.asarray(n, dtype=np.int64)
+    k = np.ceil((np.sqrt(n) - 1) / 2).astype(np.int64)
+    t = 2 * k
+    m = (2 * k + 1) ** 2
+
+    x = k - (m - n)
+    y = -k
+    m2 = m - t
+    side = n < m - t
+    x = np.where(side, -k, x)
+    y = np.where(side, -k + (m2 - n), y)
+    m3 = m2 - t
+    side = n < m2 - t
+    x = np.where(side, -k + (m3 - n), x)
+    y = np.where(side, k, y)
+    side = n < m3 - t
+    x = np.where(side, k, x)
+    y = np.where(side, k - (m3 - n - t), y)
+    return x, y
+
+
+def digital_root(n):
+    """Calculate digital root of a number"""
+    if n == 0:
+        return 0
+    return 1 + (n - 1) % 9
@@ -6,44 +6,56 @@ Ulam Spiral: Prime numbers visualization
 from manim import *
 import numpy as np
 
+from batched_lag import BatchedFadeIn
+from lod_number_line import LODNumberLine
+from memory_budget import MemoryBudgetMixin
+from number_theory import fibonacci, primes_up_to
+from prime_count import comparison_table
+from scene_params import ParametrizedScene
+from spiral_layouts import layout_points
+from spatial_index import CullingMixin
+from static_hold import StaticHoldMixin
+
 # Note: For zoom effects, we use MovingCameraScene instead of Scene
 
-class UlamSpiral(MovingCameraScene):
+class UlamSpiral(ParametrizedScene, MemoryBudgetMixin, CullingMixin, StaticHoldMixin, MovingCameraScene):
     """
     Ulam Spiral - Visualizing prime number patterns
     Numbers arranged in spiral, primes highlighted
     """
     
+    PARAMS = {
+        "n_max": 500,
+        "layout": "ulam",
+        "scale": 0.08,
+        "dot_radius": 0.03,
+        "prime_color": "BLUE",
+        "fade_run_time": 3,
+        "zoom": 0.5,
+    }
+    
     def construct(self):
+        p = self.params
+        
         # Title
         title = Text("Ulam Spiral", font_size=48)
         title.to_edge(UP)
         self.play(Write(title))
         
         # Generate Ulam spiral
-        n_points = 500
-        dots = VGroup()
-        
-        for i in range(1, n_points + 1):
-            x, y = self.spiral_coords(i)
-            if self.is_prime(i):
-                dot = Dot(
-                    point=[x * 0.08, y * 0.08, 0],
-                    radius=0.03,
-                    color=BLUE
-                )
-                dots.add(dot)
+        n_points = p["n_max"]
+        points, _ = layout_points(p["layout"], n_points, scale=p["scale"], center=False)
+        dots = self.dot_group(points, p["dot_radius"], self.color("prime_color"), "prime dots")
         
         # Center the spiral
         dots.move_to(ORIGIN)
         
-        # Animate with lag
+        # Animate with lag (one vectorized update per frame for all dots)
         self.play(
-            LaggedStartMap(
-                FadeIn, 
+            BatchedFadeIn(
                 dots, 
                 lag_ratio=0.002,
-                run_time=3
+                run_time=p["fade_run_time"]
             )
         )
         
@@ -56,14 +68,14 @@ class UlamSpiral(MovingCameraScene):
         
         # Zoom in (Mesmerizing effect)
         self.play(
-            self.camera.frame.animate.scale(0.5).move_to(dots.get_center()),
+            self.camera.frame.animate.scale(p["zoom"]).move_to(dots.get_center()),
             run_time=2
         )
         self.wait(1)
         
         # Zoom out
         self.play(
-            self.camera.frame.animate.scale(2).move_to(ORIGIN),
+            self.camera.frame.animate.scale(1 / p["zoom"]).move_to(ORIGIN),
             run_time=2
         )
         
@@ -72,51 +84,9 @@ class UlamSpiral(MovingCameraScene):
         msg.to_edge(DOWN)
         self.play(FadeIn(msg))
         self.wait(2)
-    
-    def is_prime(self, n):
-        """Check if number is prime"""
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
-        for i in range(3, int(np.sqrt(n)) + 1, 2):
-            if n % i == 0:
-                return False
-        return True
-    
-    def spiral_coords(self, n):
-        """
-        Convert index to spiral coordinates (Ulam spiral)
-        Returns (x, y) position on the spiral
-        """
-        if n == 1:
-            return (0, 0)
-        
-        # Find the ring number
-        k = int(np.ceil((np.sqrt(n) - 1) / 2))
-        
-        # Find position in ring
-        t = 2 * k + 1
-        m = t ** 2
-        t = t - 1
-        
-        if n >= m - t:
-            return (k - (m - n), -k)
-        else:
-            m = m - t
-            if n >= m - t:
-                return (-k, -k + (m - n))
-            else:
-                m = m - t
-                if n >= m - t:
-                    return (-k + (m - n), k)
-                else:
-                    return (k, k - (m - n - t))
 
 
-class FibonacciGolden(Scene):
+class FibonacciGolden(StaticHoldMixin, Scene):
     """
     Fibonacci sequence and Golden Ratio visualization
     """
@@ -128,9 +98,7 @@ class FibonacciGolden(Scene):
         self.play(Write(title))
         
         # Fibonacci sequence
-        fib = [1, 1]
-        for i in range(12):
-            fib.append(fib[-1] + fib[-2])
+        fib = fibonacci(14)
         
         # Build golden spiral with squares
         squares = VGroup()
@@ -198,22 +166,36 @@ class FibonacciGolden(Scene):
         self.wait(3)
 
 
-class PrimeDistribution(Scene):
+class PrimeDistribution(ParametrizedScene, StaticHoldMixin, Scene):
     """
     Prime number distribution visualization
     Shows density and patterns
     """
     
+    PARAMS = {
+        "n_max": 100,
+        "tick_step": 5,
+        "dot_radius": 0.1,
+        "dot_color": "BLUE",
+        "reveal_run_time": 2,
+        "decades": 10,
+    }
+    
     def construct(self):
+        p = self.params
+        n_max = p["n_max"]
+        
         # Title
         title = Text("Prime Number Distribution", font_size=40)
         title.to_edge(UP)
         self.play(Write(title))
         
         # Create number line
-        number_line = NumberLine(
-            x_range=[0, 100, 5],
+        number_line = LODNumberLine(
+            0, n_max,
             length=12,
+            min_tick_step=p["tick_step"],
+            max_labels=0,
             color=WHITE
         )
         number_line.center()
@@ -221,23 +203,23 @@ class PrimeDistribution(Scene):
         self.play(Create(number_line))
         
         # Highlight primes
-        primes = [p for p in range(2, 100) if self.is_prime(p)]
+        primes = primes_up_to(n_max - 1)
         
         prime_dots = VGroup()
-        for p in primes:
-            pos = number_line.number_to_point(p)
-            dot = Dot(point=pos, radius=0.1, color=BLUE)
+        for prime in primes:
+            pos = number_line.number_to_point(prime)
+            dot = Dot(point=pos, radius=p["dot_radius"], color=self.color("dot_color"))
             prime_dots.add(dot)
         
         self.play(LaggedStartMap(
             FadeIn,
             prime_dots,
             lag_ratio=0.05,
-            run_time=2
+            run_time=p["reveal_run_time"]
         ))
         
         # Add prime count
-        count_text = Text(f"25 primes in first 100 numbers", font_size=24)
+        count_text = Text(f"{len(primes)} primes in first {n_max} numbers", font_size=24)
         count_text.to_edge(DOWN)
         self.play(FadeIn(count_text))
         
@@ -252,14 +234,48 @@ class PrimeDistribution(Scene):
         self.play(Write(formula))
         
         self.wait(3)
+        
+        if p["decades"]:
+            self.show_decades(title, formula, VGroup(number_line, prime_dots, count_text))
     
-    def is_prime(self, n):
-        if n < 2:
-            return False
-        for i in range(2, int(np.sqrt(n)) + 1):
-            if n % i == 0:
-                return False
-        return True
+    def show_decades(self, title, formula, previous):
+        """Exact pi(x) against n/ln(n) and Li(x) for x = 10, 100, ..."""
+        self.play(
+            FadeOut(previous),
+            formula.animate.next_to(title, DOWN)
+        )
+        
+        columns = [-4.5, -1.5, 1.5, 4.5]
+        header = VGroup(*[
+            Text(label, font_size=22, color=YELLOW).move_to([x, 0, 0])
+            for label, x in zip(["x", "π(x)", "x / ln x", "Li(x)"], columns)
+        ])
+        # Only move vertically, columns stay on their fixed x positions
+        header.set_y(formula.get_bottom()[1] - 0.5)
+        self.play(FadeIn(header))
+        
+        rows = VGroup()
+        for i, row in enumerate(comparison_table(self.params["decades"])):
+            values = [
+                f"10^{i + 1}",
+                f"{row['pi']:,}",
+                f"{row['x_over_ln']:,.0f}",
+                f"{row['li']:,.0f}",
+            ]
+            cells = VGroup(*[
+                Text(value, font_size=18, color=BLUE if j == 1 else WHITE).move_to([x, 0, 0])
+                for j, (value, x) in enumerate(zip(values, columns))
+            ])
+            cells.set_y(header.get_y() - 0.5 - i * 0.42)
+            rows.add(cells)
+        
+        self.play(LaggedStartMap(FadeIn, rows, lag_ratio=0.3), run_time=3)
+        
+        note = Text("Li(x) stays far closer to π(x) than x / ln x", font_size=22, color=GOLD)
+        note.to_edge(DOWN)
+        self.play(FadeIn(note))
+        
+        self.wait(3)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,14 @@ MathCLI Pro - REAL Mathematical Animations
 from manim import *
 import numpy as np
 
-class FibonacciSpiralBuild(Scene):
+from lod_number_line import LODNumberLine
+from number_theory import fibonacci
+from scene_params import ParametrizedScene
+from spiral_layouts import layout_points
+from static_hold import StaticHoldMixin
+from timeline import TimelineMixin
+
+class FibonacciSpiralBuild(TimelineMixin, StaticHoldMixin, Scene):
     """
     Fibonacci Spiral - Construiește pătratele și spirala ANIMAT pas cu pas
     Demonstrează VIZUAL cum apare golden ratio din Fibonacci
@@ -20,7 +27,7 @@ class FibonacciSpiralBuild(Scene):
         self.wait(0.5)
         
         # Fibonacci sequence
-        fib = [1, 1, 2, 3, 5, 8, 13, 21]
+        fib = fibonacci(8)
         scale = 0.35
         
         # Colors for each square
@@ -39,71 +46,73 @@ class FibonacciSpiralBuild(Scene):
         
         spiral_arcs = VGroup()
         
-        for i, f in enumerate(fib):
-            # Create square with animation
-            sq = Square(side_length=f * scale)
-            sq.set_stroke(colors[i % len(colors)], width=3)
-            sq.set_fill(colors[i % len(colors)], opacity=0.2)
+        # 24 short plays (square, number, arc) fused into one segment
+        with self.timeline():
+            for i, f in enumerate(fib):
+                # Create square with animation
+                sq = Square(side_length=f * scale)
+                sq.set_stroke(colors[i % len(colors)], width=3)
+                sq.set_fill(colors[i % len(colors)], opacity=0.2)
             
-            # Position based on spiral pattern
-            if i == 0:
-                sq.move_to(current_pos)
-                current_pos = sq.get_corner(UR)
-            elif i == 1:
-                sq.next_to(squares[-1], RIGHT, buff=0)
-                sq.align_to(squares[-1], UP)
-                current_pos = sq.get_corner(UR)
-            elif i == 2:
-                sq.next_to(squares[-1], UP, buff=0)
-                sq.align_to(squares[-1], LEFT)
-                current_pos = sq.get_corner(UL)
-            elif i == 3:
-                sq.next_to(squares[-1], LEFT, buff=0)
-                sq.align_to(squares[-1], DOWN)
-                current_pos = sq.get_corner(DL)
-            elif i == 4:
-                sq.next_to(squares[-1], LEFT, buff=0)
-                sq.align_to(squares[-1], UP)
-                current_pos = sq.get_corner(UL)
-            elif i == 5:
-                sq.next_to(squares[-1], DOWN, buff=0)
-                sq.align_to(squares[-1], LEFT)
-                current_pos = sq.get_corner(DL)
-            elif i == 6:
-                sq.next_to(squares[-1], RIGHT, buff=0)
-                sq.align_to(squares[-1], DOWN)
-                current_pos = sq.get_corner(DR)
-            elif i == 7:
-                sq.next_to(squares[-1], RIGHT, buff=0)
-                sq.align_to(squares[-1], DOWN)
-                current_pos = sq.get_corner(DR)
+                # Position based on spiral pattern
+                if i == 0:
+                    sq.move_to(current_pos)
+                    current_pos = sq.get_corner(UR)
+                elif i == 1:
+                    sq.next_to(squares[-1], RIGHT, buff=0)
+                    sq.align_to(squares[-1], UP)
+                    current_pos = sq.get_corner(UR)
+                elif i == 2:
+                    sq.next_to(squares[-1], UP, buff=0)
+                    sq.align_to(squares[-1], LEFT)
+                    current_pos = sq.get_corner(UL)
+                elif i == 3:
+                    sq.next_to(squares[-1], LEFT, buff=0)
+                    sq.align_to(squares[-1], DOWN)
+                    current_pos = sq.get_corner(DL)
+                elif i == 4:
+                    sq.next_to(squares[-1], LEFT, buff=0)
+                    sq.align_to(squares[-1], UP)
+                    current_pos = sq.get_corner(UL)
+                elif i == 5:
+                    sq.next_to(squares[-1], DOWN, buff=0)
+                    sq.align_to(squares[-1], LEFT)
+                    current_pos = sq.get_corner(DL)
+                elif i == 6:
+                    sq.next_to(squares[-1], RIGHT, buff=0)
+                    sq.align_to(squares[-1], DOWN)
+                    current_pos = sq.get_corner(DR)
+                elif i == 7:
+                    sq.next_to(squares[-1], RIGHT, buff=0)
+                    sq.align_to(squares[-1], DOWN)
+                    current_pos = sq.get_corner(DR)
             
-            # Animate square appearing
-            self.play(
-                Create(sq),
-                run_time=0.5
-            )
-            squares.add(sq)
+                # Animate square appearing
+                self.play(
+                    Create(sq),
+                    run_time=0.5
+                )
+                squares.add(sq)
             
-            # Add number
-            num = Text(str(f), font_size=20, color=colors[i % len(colors)])
-            num.move_to(sq.get_center())
-            self.play(FadeIn(num), run_time=0.2)
-            numbers.add(num)
+                # Add number
+                num = Text(str(f), font_size=20, color=colors[i % len(colors)])
+                num.move_to(sq.get_center())
+                self.play(FadeIn(num), run_time=0.2)
+                numbers.add(num)
             
-            # Draw spiral arc
-            if i > 0:
-                arc_radius = f * scale
-                # Approximate arc using Arc
-                arc = Arc(
-                    radius=arc_radius,
-                    start_angle=PI/2 * ((i-1) % 4),
-                    angle=-PI/2,
-                    arc_center=current_pos
-                )
-                arc.set_stroke(GOLD, width=2)
-                self.play(Create(arc), run_time=0.3)
-                spiral_arcs.add(arc)
+                # Draw spiral arc
+                if i > 0:
+                    arc_radius = f * scale
+                    # Approximate arc using Arc
+                    arc = Arc(
+                        radius=arc_radius,
+                        start_angle=PI/2 * ((i-1) % 4),
+                        angle=-PI/2,
+                        arc_center=current_pos
+                    )
+                    arc.set_stroke(GOLD, width=2)
+                    self.play(Create(arc), run_time=0.3)
+                    spiral_arcs.add(arc)
         
         # Show the golden ratio emerging
         self.wait(1)
@@ -133,13 +142,25 @@ class FibonacciSpiralBuild(Scene):
         self.wait(3)
 
 
-class PrimeSpiralAnimated(Scene):
+class PrimeSpiralAnimated(ParametrizedScene, StaticHoldMixin, Scene):
     """
     Ulam Spiral ANIMATED - prime numbers populează spirala treptat
     Arată VIZUAL cum primes formează pattern-uri
     """
     
+    PARAMS = {
+        "max_num": 300,
+        "layout": "ulam",
+        "batch_size": 50,
+        "scale": 0.12,
+        "dot_radius": 0.04,
+        "prime_color": "BLUE_C",
+        "batch_run_time": 0.8,
+    }
+    
     def construct(self):
+        p = self.params
+        
         # Title
         title = Text("Ulam Prime Spiral", font_size=40)
         title.to_edge(UP)
@@ -150,53 +171,20 @@ class PrimeSpiralAnimated(Scene):
         info.next_to(title, DOWN)
         self.play(FadeIn(info))
         
-        # Generate spiral coordinates
-        def spiral_coords(n):
-            if n == 1:
-                return (0, 0)
-            k = int(np.ceil((np.sqrt(n) - 1) / 2))
-            t = 2 * k + 1
-            m = t ** 2
-            t = t - 1
-            if n >= m - t:
-                return (k - (m - n), -k)
-            else:
-                m = m - t
-                if n >= m - t:
-                    return (-k, -k + (m - n))
-                else:
-                    m = m - t
-                    if n >= m - t:
-                        return (-k + (m - n), k)
-                    else:
-                        return (k, k - (m - n - t))
-        
-        def is_prime(n):
-            if n < 2: return False
-            if n == 2: return True
-            if n % 2 == 0: return False
-            for i in range(3, int(np.sqrt(n)) + 1, 2):
-                if n % i == 0: return False
-            return True
-        
         # Create dots progressively
         dots_group = VGroup()
         
         # Batch animations for efficiency
-        batch_size = 50
-        max_num = 300
+        batch_size = p["batch_size"]
+        max_num = p["max_num"]
+        points, numbers = layout_points(p["layout"], max_num, scale=p["scale"], center=False)
         
         for batch_start in range(1, max_num, batch_size):
-            batch_dots = VGroup()
-            for n in range(batch_start, min(batch_start + batch_size, max_num + 1)):
-                x, y = spiral_coords(n)
-                if is_prime(n):
-                    dot = Dot(
-                        point=[x * 0.12, y * 0.12, 0],
-                        radius=0.04,
-                        color=BLUE_C
-                    )
-                    batch_dots.add(dot)
+            in_batch = (numbers >= batch_start) & (numbers < batch_start + batch_size)
+            batch_dots = VGroup(*[
+                Dot(point=point, radius=p["dot_radius"], color=self.color("prime_color"))
+                for point in points[in_batch]
+            ])
             
             if len(batch_dots) > 0:
                 batch_dots.move_to(ORIGIN)
@@ -205,7 +193,7 @@ class PrimeSpiralAnimated(Scene):
                         GrowFromCenter,
                         batch_dots,
                         lag_ratio=0.01,
-                        run_time=0.8
+                        run_time=p["batch_run_time"]
                     )
                 )
                 dots_group.add(*batch_dots)
@@ -231,7 +219,7 @@ class PrimeSpiralAnimated(Scene):
         self.wait(3)
 
 
-class GoldenRatioVisualization(Scene):
+class GoldenRatioVisualization(StaticHoldMixin, Scene):
     """
     Golden Ratio φ - Demonstrație VIZUALĂ a proporției divine
     Arată cum φ apare în geometrie și natură
@@ -338,7 +326,7 @@ class GoldenRatioVisualization(Scene):
         self.wait(3)
 
 
-class NumberLineAnimation(Scene):
+class NumberLineAnimation(StaticHoldMixin, Scene):
     """
     Number Line - Arată divizibilitate și proprietăți numerice
     Vizualizează ce fac numerele speciale
@@ -354,24 +342,26 @@ class NumberLineAnimation(Scene):
         numbers_to_show = 30
         line_length = 12
         
-        number_line = NumberLine(
-            x_range=[0, numbers_to_show, 1],
+        # Ticks and labels are generated for the visible range only
+        number_line = LODNumberLine(
+            0, numbers_to_show,
             length=line_length,
+            max_labels=numbers_to_show + 1,
             color=WHITE
         )
         number_line.center().shift(DOWN * 0.5)
         
-        self.play(Create(number_line), run_time=2)
+        # The whole line is in the scene from the start (labels hidden), so
+        # zoom_to later moves and replaces the labels shown here
+        number_line.labels.set_opacity(0)
+        self.add(number_line)
+        self.play(Create(number_line.axis), Create(number_line.ticks), run_time=2)
         
         # Animate numbers appearing one by one
-        number_labels = VGroup()
-        for i in range(1, numbers_to_show + 1):
-            label = Text(str(i), font_size=16)
-            pos = number_line.number_to_point(i)
-            label.move_to(pos + DOWN * 0.4)
-            number_labels.add(label)
-        
-        self.play(LaggedStartMap(FadeIn, number_labels, lag_ratio=0.05), run_time=2)
+        self.play(
+            LaggedStart(*[label.animate.set_opacity(1) for label in number_line.labels], lag_ratio=0.05),
+            run_time=2
+        )
         
         # Highlight primes
         primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
@@ -414,7 +404,7 @@ class NumberLineAnimation(Scene):
         self.wait(1)
         
         # Highlight Fibonacci
-        fib = [1, 1, 2, 3, 5, 8, 13, 21]
+        fib = fibonacci(8)
         fib_dots = VGroup()
         
         for f in fib:
@@ -443,6 +433,15 @@ class NumberLineAnimation(Scene):
         self.play(Write(obs))
         
         self.wait(3)
+        
+        # Zoom out to a billion: same label budget, labels cached by value
+        self.play(FadeOut(VGroup(
+            prime_dots, square_dots, fib_dots,
+            prime_label, square_label, fib_label, obs
+        )))
+        self.play(number_line.zoom_to(0, 10**9), run_time=4)
+        
+        self.wait(2)
 
 
 if __name__ == "__main__":
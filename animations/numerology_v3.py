@@ -6,7 +6,19 @@ Vortex Math, Sacred Geometry, Perfect Numbers, Digital Roots
 from manim import *
 import numpy as np
 
-class VortexMathDoubling(Scene):
+from batched_lag import BatchedFadeIn, BatchedGrowFromCenter
+from memory_budget import MemoryBudgetMixin, mobject_bytes
+from mersenne import format_perfect_number, mersenne_exponents
+from number_theory import digital_roots, prime_sieve, proper_divisors
+from scene_params import ParametrizedScene
+from spiral_layouts import layout_points, prime_cloud
+from spatial_index import CullingMixin
+from static_hold import StaticHoldMixin
+from tiled_raster import TiledRenderMixin
+from timeline import TimelineMixin
+from ulam_analytics import diagonal_endpoints, ray_points, top_diagonals, top_quadratic_rays
+
+class VortexMathDoubling(TimelineMixin, StaticHoldMixin, Scene):
     """
     Vortex Math - The Doubling Circuit (1-2-4-8-7-5)
     Tesla's 3-6-9 pattern revealed through digit sum doubling
@@ -51,22 +63,23 @@ class VortexMathDoubling(Scene):
         circles = VGroup()
         number_texts = VGroup()
         
-        for i, (pos, num) in enumerate(zip(positions, labels)):
-            circle = Circle(radius=0.6)
-            circle.move_to(pos)
-            circle.set_stroke(PURPLE, width=3)
-            circle.set_fill(PURPLE, opacity=0.2)
+        with self.timeline():
+            for i, (pos, num) in enumerate(zip(positions, labels)):
+                circle = Circle(radius=0.6)
+                circle.move_to(pos)
+                circle.set_stroke(PURPLE, width=3)
+                circle.set_fill(PURPLE, opacity=0.2)
             
-            num_text = Text(str(num), font_size=36)
-            num_text.move_to(pos)
+                num_text = Text(str(num), font_size=36)
+                num_text.move_to(pos)
             
-            self.play(
-                Create(circle),
-                FadeIn(num_text),
-                run_time=0.5
-            )
-            circles.add(circle)
-            number_texts.add(num_text)
+                self.play(
+                    Create(circle),
+                    FadeIn(num_text),
+                    run_time=0.5
+                )
+                circles.add(circle)
+                number_texts.add(num_text)
         
         # Animate the doubling circuit with arrows
         self.wait(0.5)
@@ -102,7 +115,7 @@ class VortexMathDoubling(Scene):
         self.wait(1)
         
         # Highlight 3, 6, 9 as the controllers
-        self.play(FadeOut(arrows))
+        self.play(FadeOut(path_arcs))
         
         # Create center circle with 3-6-9
         center_circle = Circle(radius=0.8)
@@ -147,13 +160,20 @@ class VortexMathDoubling(Scene):
         self.wait(3)
 
 
-class DigitalRoots9(Scene):
+class DigitalRoots9(ParametrizedScene, MemoryBudgetMixin, TiledRenderMixin, StaticHoldMixin, Scene):
     """
     Digital Roots - The Power of 9
     Shows how all numbers reduce to 1-9, with 9 as the master
     """
     
+    PARAMS = {
+        "grid_size": 9,
+        "cell_size": 0.6,
+    }
+    
     def construct(self):
+        p = self.params
+        
         # Title
         title = Text("Digital Roots", font_size=44)
         title.to_edge(UP)
@@ -163,12 +183,24 @@ class DigitalRoots9(Scene):
         sub.next_to(title, DOWN)
         self.play(FadeIn(sub))
         
-        # Create a 9x9 grid showing digital roots
-        grid_size = 9
-        cell_size = 0.6
+        # Create a grid_size x grid_size grid showing digital roots
+        grid_size = p["grid_size"]
+        cell_size = p["cell_size"]
         grid = VGroup()
         numbers = VGroup()
         
+        # Check the grid against the memory budget before building it:
+        # too large a grid keeps the colored cells and drops the digits
+        cells = grid_size * grid_size
+        square_bytes = mobject_bytes(Square(side_length=cell_size))
+        digit_bytes = mobject_bytes(Text("9", font_size=14))
+        show_digits = self.fits_or_degrade(
+            cells * (square_bytes + digit_bytes),
+            cells * square_bytes,
+            f"a {grid_size}x{grid_size} grid",
+            "colored cells without digits"
+        )
+        
         colors = {
             1: RED, 2: ORANGE, 3: YELLOW, 4: GREEN,
             5: TEAL, 6: BLUE, 7: PURPLE, 8: PINK, 9: WHITE
@@ -176,11 +208,11 @@ class DigitalRoots9(Scene):
         
         start_x = -4
         start_y = 2
+        roots = digital_roots(np.arange(1, cells + 1))
         
         for row in range(grid_size):
             for col in range(grid_size):
-                num = row * grid_size + col + 1
-                digital_root = self.digital_root(num)
+                digital_root = int(roots[row * grid_size + col])
                 
                 # Create cell
                 rect = Square(side_length=cell_size)
@@ -191,28 +223,32 @@ class DigitalRoots9(Scene):
                 ])
                 rect.set_fill(colors[digital_root], opacity=0.3)
                 rect.set_stroke(colors[digital_root], width=1)
+                grid.add(rect)
                 
                 # Add number
-                num_text = Text(str(digital_root), font_size=14)
-                num_text.move_to(rect.get_center())
-                
-                grid.add(rect)
-                numbers.add(num_text)
+                if show_digits:
+                    num_text = Text(str(digital_root), font_size=14)
+                    num_text.move_to(rect.get_center())
+                    numbers.add(num_text)
+        
+        self.hold(grid, cells * square_bytes)
+        if show_digits:
+            self.hold(numbers, cells * digit_bytes)
         
         self.play(
-            LaggedStartMap(FadeIn, grid, lag_ratio=0.01),
-            run_time=1
-        )
-        self.play(
-            LaggedStartMap(FadeIn, numbers, lag_ratio=0.01),
+            BatchedFadeIn(grid, lag_ratio=0.01),
             run_time=1
         )
+        if show_digits:
+            self.play(
+                BatchedFadeIn(numbers, lag_ratio=0.01),
+                run_time=1
+            )
         
         # Highlight the 9s
         nines = VGroup()
-        for i, num_text in enumerate(numbers):
-            rect = grid[i]
-            if num_text.text == "9":
+        for i, rect in enumerate(grid):
+            if roots[i] == 9:
                 rect.set_fill(WHITE, opacity=0.8)
                 nines.add(rect)
         
@@ -254,21 +290,36 @@ class DigitalRoots9(Scene):
         self.play(FadeIn(special))
         
         self.wait(3)
-    
-    def digital_root(self, n):
-        """Calculate digital root of a number"""
-        if n == 0:
-            return 0
-        return 1 + (n - 1) % 9
 
 
-class PerfectNumbers(Scene):
+class PerfectNumbers(ParametrizedScene, StaticHoldMixin, Scene):
     """
     Perfect Numbers - Numbers equal to sum of their divisors
-    6, 28, 496, 8128, 33550336...
+    6, 28, 496, 8128, 33550336... found through Mersenne exponents, so the
+    list can run far past the fifth one (huge ones shown as lead…trail)
     """
     
+    PARAMS = {
+        "examples": [6, 28],
+        "list_count": 5,
+        "number_color": "TEAL",
+        "sum_color": "GREEN",
+        "formula_color": "GOLD",
+    }
+    
+    # Historical notes for the list (computed numbers without a note get none)
+    # Keyed by the Mersenne exponent p of 2^(p-1) * (2^p - 1)
+    DISCOVERY = {
+        2: "Known since antiquity",     # 6
+        3: "Known since antiquity",     # 28
+        5: "Discovery: ~300 BCE",       # 496
+        7: "Discovery: ~100 CE",        # 8128
+        13: "Discovery: 1456",          # 33550336
+    }
+    
     def construct(self):
+        p = self.params
+        
         # Title
         title = Text("Perfect Numbers", font_size=44, color=GOLD)
         title.to_edge(UP)
@@ -282,89 +333,40 @@ class PerfectNumbers(Scene):
         def_text.next_to(title, DOWN)
         self.play(FadeIn(def_text))
         
-        # First perfect number: 6
-        self.wait(0.5)
-        
-        six = Text("6", font_size=72, color=TEAL)
-        six.move_to(UP * 1 + LEFT * 4)
-        self.play(Write(six))
-        
-        divisors_6 = VGroup()
-        divs_6 = [1, 2, 3]
-        for i, d in enumerate(divs_6):
-            d_text = Text(str(d), font_size=36)
-            d_text.move_to(UP * 1 + RIGHT * (1 + i * 1.2))
-            divisors_6.add(d_text)
-        
-        self.play(LaggedStartMap(FadeIn, divisors_6, lag_ratio=0.2))
-        
-        # Show sum
-        sum_text = Text("1 + 2 + 3 = 6", font_size=32, color=GREEN)
-        sum_text.to_edge(LEFT).shift(DOWN * 0.5)
-        self.play(Write(sum_text))
-        
-        # Checkmark
-        check = Text("✓", font_size=48, color=GREEN)
-        check.next_to(six, RIGHT, buff=0.3)
-        self.play(FadeIn(check))
-        
         self.wait(0.5)
         
-        # Second: 28
-        self.play(
-            FadeOut(six), FadeOut(divisors_6), 
-            FadeOut(sum_text), FadeOut(check)
-        )
-        
-        twenty_eight = Text("28", font_size=72, color=TEAL)
-        twenty_eight.move_to(UP * 1 + LEFT * 3)
-        self.play(Write(twenty_eight))
-        
-        divs_28 = [1, 2, 4, 7, 14]
-        divisors_28 = VGroup()
-        for i, d in enumerate(divs_28):
-            d_text = Text(str(d), font_size=28)
-            d_text.move_to(UP * 1 + RIGHT * (0.5 + i * 1))
-            divisors_28.add(d_text)
-        
-        self.play(LaggedStartMap(FadeIn, divisors_28, lag_ratio=0.15))
-        
-        sum_28 = Text("1+2+4+7+14 = 28", font_size=28, color=GREEN)
-        sum_28.to_edge(LEFT).shift(DOWN * 0.5)
-        self.play(Write(sum_28))
-        
-        check2 = Text("✓", font_size=48, color=GREEN)
-        check2.next_to(twenty_eight, RIGHT, buff=0.3)
-        self.play(FadeIn(check2))
-        
-        self.wait(0.5)
+        # Walk through each example: number, divisors, sum, checkmark
+        for n in p["examples"]:
+            self.show_divisor_sum(n)
         
         # Show list of known perfect numbers
-        self.play(
-            FadeOut(twenty_eight), FadeOut(divisors_28),
-            FadeOut(sum_28), FadeOut(check2), FadeOut(def_text)
-        )
+        self.play(FadeOut(def_text))
         
         perfect_nums = [
-            (6, "Known since antiquity"),
-            (28, "Known since antiquity"),
-            (496, "Discovery: ~300 BCE"),
-            (8128, "Discovery: ~100 CE"),
-            (33550336, "Discovery: 1456"),
+            (format_perfect_number(exp), self.DISCOVERY.get(exp, f"p = {exp}"))
+            # In-process: a handful of small exponents, and construct() may
+            # run in a forked render worker
+            for exp in mersenne_exponents(count=p["list_count"], workers=1)
         ]
         
         list_title = Text("Known Perfect Numbers", font_size=32)
         list_title.to_edge(UP)
         self.play(Write(list_title))
         
+        # Up to five rows keep the classic layout, longer lists start
+        # higher and tighten up to fit above the formula
+        compact = len(perfect_nums) > 5
+        top = UP * 2.2 if compact else DOWN * 0.5
+        row_step = min(0.6, 5.2 / len(perfect_nums)) if compact else 0.6
+        font_size = 28 * row_step / 0.6
         perfect_list = VGroup()
-        for i, (num, desc) in enumerate(perfect_nums):
-            num_text = Text(f"{num:,}", font_size=28, color=TEAL)
-            desc_text = Text(desc, font_size=18, color=GRAY)
+        for i, (label, desc) in enumerate(perfect_nums):
+            num_text = Text(label, font_size=font_size, color=self.color("number_color"))
+            desc_text = Text(desc, font_size=font_size * 0.65, color=GRAY)
             
             row = VGroup(num_text, desc_text)
             row.arrange(RIGHT, buff=0.5)
-            row.move_to(DOWN * (0.5 + i * 0.6))
+            row.move_to(top + DOWN * i * row_step)
             perfect_list.add(row)
         
         self.play(LaggedStartMap(FadeIn, perfect_list, lag_ratio=0.2))
@@ -373,98 +375,162 @@ class PerfectNumbers(Scene):
         formula_text = Text(
             "Perfect numbers = 2^(p-1) × (2^p - 1) where (2^p - 1) is prime",
             font_size=20,
-            color=GOLD
+            color=self.color("formula_color")
         )
         formula_text.to_edge(DOWN)
         self.play(Write(formula_text))
         
         self.wait(3)
+    
+    def show_divisor_sum(self, n):
+        """Show n, its proper divisors and their sum, then clear them"""
+        divisors = proper_divisors(n)
+        # Short divisor lists get the roomy layout, longer ones shrink to fit
+        roomy = len(divisors) <= 3
+        
+        number = Text(str(n), font_size=72, color=self.color("number_color"))
+        number.move_to(UP * 1 + LEFT * (4 if roomy else 3))
+        self.play(Write(number))
+        
+        step = 1.2 if roomy else min(1.0, 5 / len(divisors))
+        font_size = 36 if roomy else min(28, 28 * 5 / len(divisors))
+        divisor_texts = VGroup()
+        for i, d in enumerate(divisors):
+            d_text = Text(str(d), font_size=font_size)
+            d_text.move_to(UP * 1 + RIGHT * ((1 if roomy else 0.5) + i * step))
+            divisor_texts.add(d_text)
+        
+        self.play(LaggedStartMap(FadeIn, divisor_texts, lag_ratio=0.2 if roomy else 0.15))
+        
+        # Show sum
+        joiner = " + " if roomy else "+"
+        sum_text = Text(
+            f"{joiner.join(map(str, divisors))} = {sum(divisors)}",
+            font_size=32 if roomy else 28,
+            color=self.color("sum_color")
+        )
+        sum_text.to_edge(LEFT).shift(DOWN * 0.5)
+        self.play(Write(sum_text))
+        
+        # Checkmark
+        check = Text("✓", font_size=48, color=self.color("sum_color"))
+        check.next_to(number, RIGHT, buff=0.3)
+        self.play(FadeIn(check))
+        
+        self.wait(0.5)
+        
+        self.play(
+            FadeOut(number), FadeOut(divisor_texts),
+            FadeOut(sum_text), FadeOut(check)
+        )
 
 
-class UlamSpiralDetailed(MovingCameraScene):
+class UlamSpiralDetailed(ParametrizedScene, MemoryBudgetMixin, CullingMixin, StaticHoldMixin, MovingCameraScene):
     """
     Enhanced Ulam Spiral with zoom and pattern highlighting
     """
     
+    PARAMS = {
+        "n_max": 400,
+        "scale": 0.08,
+        "prime_radius": 0.04,
+        "composite_radius": 0.02,
+        "prime_color": "BLUE",
+        "composite_color": "GRAY_E",
+        "zoom": 0.3,
+        "highlight_lines": 3,
+        "highlight_color": "YELLOW",
+        "highlight_rays": 2,
+        "ray_color": "ORANGE",
+    }
+    
     def construct(self):
+        p = self.params
+        
         # Title
         title = Text("Ulam Spiral", font_size=40)
         title.to_edge(UP)
         self.add(title)
         
-        # Generate spiral coordinates
-        def spiral_coords(n):
-            if n == 1:
-                return (0, 0)
-            k = int(np.ceil((np.sqrt(n) - 1) / 2))
-            t = 2 * k + 1
-            m = t ** 2
-            t = t - 1
-            if n >= m - t:
-                return (k - (m - n), -k)
-            else:
-                m = m - t
-                if n >= m - t:
-                    return (-k, -k + (m - n))
-                else:
-                    m = m - t
-                    if n >= m - t:
-                        return (-k + (m - n), k)
-                    else:
-                        return (k, k - (m - n - t))
-        
-        def is_prime(n):
-            if n < 2: return False
-            if n == 2: return True
-            if n % 2 == 0: return False
-            for i in range(3, int(np.sqrt(n)) + 1, 2):
-                if n % i == 0: return False
-            return True
-        
         # Create spiral with animation
-        n_max = 400
-        scale = 0.08
-        
-        # Draw all dots
-        all_dots = VGroup()
-        prime_dots = VGroup()
-        
-        for n in range(1, n_max + 1):
-            x, y = spiral_coords(n)
-            pos = np.array([x * scale, y * scale, 0])
-            
-            if is_prime(n):
-                dot = Dot(point=pos, radius=0.04, color=BLUE)
-                prime_dots.add(dot)
-            else:
-                dot = Dot(point=pos, radius=0.02, color=GRAY_E)
-                all_dots.add(dot)
+        n_max = p["n_max"]
+        scale = p["scale"]
+        points, numbers = layout_points("ulam", n_max, scale=scale, primes_only=False, center=False)
+        is_prime = prime_sieve(n_max)[numbers]
+        
+        # Draw all dots (point clouds when too many Dots for the memory budget)
+        all_dots = self.dot_group(
+            points[~is_prime], p["composite_radius"], self.color("composite_color"), "composite dots"
+        )
+        prime_dots = self.dot_group(
+            points[is_prime], p["prime_radius"], self.color("prime_color"), "prime dots"
+        )
         
         # Animate non-primes first (faint)
         self.play(
-            FadeIn(all_dots, lag_ratio=0.001),
+            BatchedFadeIn(all_dots, lag_ratio=0.001, rate_func=smooth, element_rate_func=linear),
             run_time=3
         )
         
         # Animate primes popping in
         self.play(
-            LaggedStartMap(GrowFromCenter, prime_dots, lag_ratio=0.002),
+            BatchedGrowFromCenter(prime_dots, lag_ratio=0.002),
             run_time=4
         )
         
         # Zoom into center
         self.play(
-            self.camera.frame.animate.scale(0.3).move_to(ORIGIN),
+            self.camera.frame.animate.scale(p["zoom"]).move_to(ORIGIN),
             run_time=2
         )
         self.wait(1)
         
         # Zoom out
         self.play(
-            self.camera.frame.animate.scale(3.3).move_to(ORIGIN),
+            self.camera.frame.animate.scale(1 / p["zoom"]).move_to(ORIGIN),
             run_time=2
         )
         
+        # Highlight the most prime-rich diagonals
+        overlays = VGroup()
+        for line in top_diagonals(n_max, k=p["highlight_lines"]):
+            start, end = diagonal_endpoints(line["kind"], line["offset"], n_max)
+            overlay = Line(
+                np.array([start[0], start[1], 0]) * scale,
+                np.array([end[0], end[1], 0]) * scale,
+                color=self.color("highlight_color"),
+                stroke_width=2,
+                stroke_opacity=0.7
+            )
+            overlays.add(overlay)
+        
+        if len(overlays) > 0:
+            self.play(LaggedStartMap(Create, overlays, lag_ratio=0.3), run_time=2)
+        
+        # Highlight the most prime-rich 4n^2 + bn + c rays, one marker per term
+        rays = top_quadratic_rays(n_max, k=p["highlight_rays"])
+        ray_overlays = VGroup()
+        for ray in rays:
+            ray_overlays.add(VGroup(*[
+                Circle(
+                    radius=p["prime_radius"] * 2,
+                    color=self.color("ray_color"),
+                    stroke_width=2
+                ).move_to(np.array([x, y, 0]) * scale)
+                for x, y in ray_points(ray["a"], ray["b"], ray["c"], n_max)
+            ]))
+        
+        if len(ray_overlays) > 0:
+            self.play(LaggedStartMap(Create, ray_overlays, lag_ratio=0.5), run_time=2)
+            best = rays[0]
+            ray_label = Text(
+                f"4n² {best['b']:+d}n {best['c']:+d}: {best['primes']}/{best['points']} prime",
+                font_size=20,
+                color=self.color("ray_color")
+            )
+            ray_label.next_to(title, DOWN)
+            self.play(FadeIn(ray_label))
+        
         # Pattern explanation
         pattern = Text(
             "Diagonal lines suggest prime distribution patterns",
@@ -481,10 +547,80 @@ class UlamSpiralDetailed(MovingCameraScene):
         self.wait(3)
 
 
+class PrimeSpiralLayouts(ParametrizedScene, StaticHoldMixin, Scene):
+    """
+    The same primes in different arrangements: Ulam, Sacks, hexagonal,
+    Klauber and a modular wheel, each drawn as one point cloud and morphed
+    into the next
+    """
+    
+    PARAMS = {
+        "n_max": 100000,
+        "layouts": ["ulam", "sacks", "hexagonal", "klauber", "wheel:6"],
+        "prime_color": "BLUE",
+        "point_size": 2,
+        "morph_run_time": 2.5,
+        "hold": 1.5,
+    }
+    
+    LAYOUT_TITLES = {
+        "ulam": "Ulam square spiral",
+        "sacks": "Sacks spiral (r = √n)",
+        "hexagonal": "Hexagonal spiral",
+        "klauber": "Klauber triangle",
+    }
+    
+    def construct(self):
+        p = self.params
+        
+        title = Text("Prime Spirals", font_size=40)
+        title.to_edge(UP)
+        self.play(Write(title))
+        
+        cloud, caption = self.layout_mobjects(p["layouts"][0])
+        self.play(FadeIn(cloud), FadeIn(caption))
+        self.wait(p["hold"])
+        
+        # Every layout orders the same primes the same way, so the clouds
+        # morph point for point
+        for name in p["layouts"][1:]:
+            target, new_caption = self.layout_mobjects(name)
+            self.play(
+                Transform(cloud, target),
+                Transform(caption, new_caption),
+                run_time=p["morph_run_time"]
+            )
+            self.wait(p["hold"])
+        
+        info = Text(f"Primes 1-{p['n_max']:,}", font_size=20)
+        info.next_to(caption, UP)
+        self.play(FadeIn(info))
+        self.wait(2)
+    
+    def layout_mobjects(self, name):
+        """Point cloud for a layout plus its caption"""
+        cloud = prime_cloud(
+            name,
+            self.params["n_max"],
+            self.color("prime_color"),
+            width=12,
+            height=5.2,
+            stroke_width=self.params["point_size"]
+        )
+        cloud.shift(DOWN * 0.3)
+        
+        base, _, modulus = name.partition(":")
+        label = self.LAYOUT_TITLES.get(base, f"Mod {modulus or 6} wheel")
+        caption = Text(label, font_size=24, color=YELLOW)
+        caption.to_edge(DOWN)
+        return cloud, caption
+
+
 if __name__ == "__main__":
     # Run individual animations:
     # python -m manim -pql numerology_v3.py VortexMathDoubling
     # python -m manim -pql numerology_v3.py DigitalRoots9
     # python -m manim -pql numerology_v3.py PerfectNumbers
     # python -m manim -pql numerology_v3.py UlamSpiralDetailed
+    # python -m manim -pql numerology_v3.py PrimeSpiralLayouts
     pass
\ No newline at end of file
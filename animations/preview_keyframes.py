@@ -0,0 +1,135 @@
+"""
+MathCLI Pro - Keyframe Preview
+Renders only the last frame of every self.play / self.wait segment at low
+resolution and saves one contact sheet per scene, so a batch can be
+approved before paying for full 1080p60 renders.
+
+Run:
+    python preview_keyframes.py                      # all numerology modules
+    python preview_keyframes.py numerology_v3        # one module
+    python preview_keyframes.py numerology_v3 PerfectNumbers
+"""
+
+import sys
+import traceback
+from pathlib import Path
+
+import numpy as np
+from manim import logger, tempconfig
+from PIL import Image, ImageDraw
+
+from scene_catalog import SCENE_MODULES, find_scenes
+
+PREVIEW_DIR = Path("media") / "previews"
+
+# Low resolution, no movie output, every animation jumped to its end
+PREVIEW_CONFIG = {
+    "pixel_width": 320,
+    "pixel_height": 180,
+    "frame_rate": 15,
+    "write_to_movie": False,
+    "save_last_frame": False,
+    "disable_caching": True,
+    "skip_animations": True,
+    "preview": False,
+    "verbosity": "WARNING",
+}
+
+SHEET_COLUMNS = 4
+CAPTION_HEIGHT = 16
+
+
+class KeyframeRecorder:
+    """
+    Scene mixin that keeps the final frame of each play/wait call
+    (self.wait goes through self.play, so one hook covers both)
+    """
+
+    def setup(self):
+        super().setup()
+        self.keyframes = []
+
+    def play(self, *args, **kwargs):
+        super().play(*args, **kwargs)
+        label = ", ".join(type(anim).__name__ for anim in self.animations or [])
+
+        # Animations were skipped, so the saved static background is stale
+        self.renderer.static_image = None
+        self.renderer.update_frame(self, ignore_skipping=True)
+        frame = self.renderer.get_frame()
+
+        # A static wait right after a play shows the same picture
+        if self.keyframes and np.array_equal(self.keyframes[-1][1], frame):
+            return
+        self.keyframes.append((label, frame))
+
+
+def record_keyframes(scene_cls):
+    """Run a scene in preview mode, returning (keyframes, error)"""
+    recorder_cls = type(scene_cls.__name__, (KeyframeRecorder, scene_cls), {})
+    scene = None
+    error = None
+    try:
+        with tempconfig(PREVIEW_CONFIG):
+            scene = recorder_cls()
+            scene.render()
+    except Exception:
+        # Keep whatever was captured before the failure, it is still useful
+        error = traceback.format_exc(limit=3)
+    keyframes = getattr(scene, "keyframes", []) if scene is not None else []
+    return keyframes, error
+
+
+def build_contact_sheet(keyframes, columns=SHEET_COLUMNS):
+    """Tile keyframes into one image with a caption under each thumbnail"""
+    if not keyframes:
+        return None
+
+    thumb_h, thumb_w = keyframes[0][1].shape[:2]
+    cell_h = thumb_h + CAPTION_HEIGHT
+    rows = (len(keyframes) + columns - 1) // columns
+
+    sheet = Image.new("RGB", (columns * thumb_w, rows * cell_h), "black")
+    draw = ImageDraw.Draw(sheet)
+
+    for i, (label, frame) in enumerate(keyframes):
+        x = (i % columns) * thumb_w
+        y = (i // columns) * cell_h
+        sheet.paste(Image.fromarray(frame).convert("RGB"), (x, y))
+        draw.text((x + 4, y + thumb_h + 2), f"{i + 1}. {label}"[:48], fill="white")
+
+    return sheet
+
+
+def preview_scene(module_name, scene_name, scene_cls):
+    """Render one scene's contact sheet, returns the output path or None"""
+    keyframes, error = record_keyframes(scene_cls)
+    if error:
+        logger.error(f"{module_name}.{scene_name} failed:\n{error}")
+
+    sheet = build_contact_sheet(keyframes)
+    if sheet is None:
+        return None
+
+    out_dir = PREVIEW_DIR / module_name
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = out_dir / f"{scene_name}.png"
+    sheet.save(out_path)
+    return out_path
+
+
+def main(argv):
+    modules = argv[:1] or SCENE_MODULES
+    wanted = set(argv[1:])
+
+    for module_name in modules:
+        for scene_name, scene_cls in find_scenes(module_name):
+            if wanted and scene_name not in wanted:
+                continue
+            out_path = preview_scene(module_name, scene_name, scene_cls)
+            status = out_path if out_path else "no frames"
+            print(f"{module_name}.{scene_name}: {status}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,182 @@
+"""
+MathCLI Pro - Warm Render Server
+A long-lived local process that pays for interpreter startup, the manim
+import, font discovery and the scene module imports once. Each render job
+(module, scene, quality, params) runs in a worker forked from that warm
+parent, so a short scene like LatexTest costs its rendering time only.
+
+Jobs arrive over a multiprocessing.connection socket (a Unix socket next to
+this file, readable by its owner only). Jobs are pickled, so the socket is
+authenticated: with RENDER_SERVER_KEY, or else with a random key the server
+writes to .render_server.key (mode 0600) on first start and clients read.
+A worker re-imports a scene module only if its file changed since the
+server loaded it. Jobs without a name get a unique one, so concurrent jobs
+never write the same output file.
+
+Run:
+    python render_server.py serve
+    python render_server.py submit latex_test LatexTest -q l
+    python render_server.py submit numerology_v3 PerfectNumbers --params '{"list_count": 8}'
+"""
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import secrets
+import sys
+import threading
+import time
+import traceback
+import uuid
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+from render_variants import QUALITY_FLAGS, check_variants, render_variant
+from scene_catalog import ALL_MODULES
+
+ROOT = Path(__file__).resolve().parent
+SOCKET_PATH = str(ROOT / ".render_server.sock")
+KEY_PATH = ROOT / ".render_server.key"
+
+# Modification times of the modules as imported by the warm parent
+loaded_mtimes = {}
+
+
+def auth_key(create=False):
+    """RENDER_SERVER_KEY, or the key file (created with mode 0600 by the server)"""
+    key = os.getenv("RENDER_SERVER_KEY")
+    if key:
+        return key.encode()
+    if create and not KEY_PATH.exists():
+        fd = os.open(KEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(secrets.token_hex(32))
+    try:
+        return KEY_PATH.read_text().strip().encode()
+    except FileNotFoundError:
+        sys.exit(f"No server key: set RENDER_SERVER_KEY or start the server first ({KEY_PATH})")
+
+
+def warm_up(module_names=ALL_MODULES):
+    """Import manim and every scene module, and fill the font caches"""
+    start = time.perf_counter()
+    import manim
+    import manimpango
+
+    manimpango.list_fonts()
+    # Laying out one Text primes Pango and manim's text SVG cache
+    with manim.tempconfig({"dry_run": True}):
+        manim.Text("warm")
+
+    for module_name in module_names:
+        importlib.import_module(module_name)
+        loaded_mtimes[module_name] = (ROOT / f"{module_name}.py").stat().st_mtime_ns
+    return time.perf_counter() - start
+
+
+def run_job(job, conn):
+    """Worker body (forked): refresh the module if edited, render, report"""
+    try:
+        module_name = job["module"]
+        current = (ROOT / f"{module_name}.py").stat().st_mtime_ns
+        if module_name not in loaded_mtimes:
+            importlib.import_module(module_name)
+        elif loaded_mtimes[module_name] != current:
+            importlib.reload(sys.modules[module_name])
+
+        start = time.perf_counter()
+        path = render_variant(job, QUALITY_FLAGS[job.get("quality", "l")])
+        conn.send({"ok": True, "path": path, "seconds": time.perf_counter() - start})
+    except Exception:
+        conn.send({"ok": False, "error": traceback.format_exc()})
+    finally:
+        conn.close()
+
+
+def handle_client(conn, context):
+    """Serve one client connection: validate, fork a worker, relay the result"""
+    try:
+        job = conn.recv()
+        job.setdefault("params", {})
+        if not job.get("name"):
+            job["name"] = f"server-{uuid.uuid4().hex[:8]}"
+        check_variants([job])
+
+        reader, writer = context.Pipe(duplex=False)
+        worker = context.Process(target=run_job, args=(job, writer), daemon=True)
+        worker.start()
+        writer.close()
+        try:
+            result = reader.recv()
+        except EOFError:
+            result = {"ok": False, "error": f"worker exited with code {worker.exitcode}"}
+        worker.join()
+        conn.send(result)
+    except Exception as e:
+        conn.send({"ok": False, "error": str(e)})
+    finally:
+        conn.close()
+
+
+def serve(address=SOCKET_PATH):
+    if os.path.exists(address):
+        os.remove(address)
+    print("Warming up (manim, fonts, scene modules)...")
+    print(f"Warm in {warm_up():.1f}s, listening on {address}")
+
+    context = multiprocessing.get_context("fork")
+    with Listener(address, family="AF_UNIX", authkey=auth_key(create=True)) as listener:
+        os.chmod(address, 0o600)
+        try:
+            while True:
+                conn = listener.accept()
+                threading.Thread(target=handle_client, args=(conn, context), daemon=True).start()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if os.path.exists(address):
+                os.remove(address)
+
+
+def submit(job, address=SOCKET_PATH):
+    """Send one job to a running server and wait for its result"""
+    with Client(address, family="AF_UNIX", authkey=auth_key()) as conn:
+        conn.send(job)
+        return conn.recv()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm manim render server")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve")
+    job_parser = commands.add_parser("submit")
+    job_parser.add_argument("module")
+    job_parser.add_argument("scene")
+    job_parser.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    job_parser.add_argument("--params", default="{}", help="JSON parameter overrides")
+    job_parser.add_argument("--name", help="output name suffix (default: unique per job)")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve()
+        return
+
+    start = time.perf_counter()
+    result = submit({
+        "module": args.module,
+        "scene": args.scene,
+        "quality": args.quality,
+        "params": json.loads(args.params),
+        "name": args.name,
+    })
+    if not result["ok"]:
+        print(result["error"], file=sys.stderr)
+        sys.exit(1)
+    print(f"{args.scene}: {result['path']} "
+          f"(render {result['seconds']:.1f}s, total {time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
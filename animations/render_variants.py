@@ -0,0 +1,131 @@
+"""
+MathCLI Pro - Batch Variant Rendering
+Renders many parameter variants of the parametrized scenes from one warm
+process: manim and every scene module are imported once, then each variant
+is just a new scene instance with different params.
+
+Variants file (JSON list). "grid" expands to the cartesian product:
+    [
+      {"module": "numerology_v3", "scene": "UlamSpiralDetailed",
+       "name": "n900", "params": {"n_max": 900}},
+      {"module": "numerology_animations", "scene": "PrimeDistribution",
+       "grid": {"n_max": [50, 100, 200], "dot_color": ["BLUE", "GOLD"]}}
+    ]
+
+Run:
+    python render_variants.py scene_variants.json -q l
+    python render_variants.py scene_variants.json -q h --jobs 4
+"""
+
+import argparse
+import importlib
+import itertools
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from scene_catalog import scene_info
+from scene_params import ParametrizedScene
+
+QUALITY_FLAGS = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def expand_variants(entries):
+    """Turn grid entries into one entry per parameter combination"""
+    variants = []
+    for entry in entries:
+        grid = entry.get("grid")
+        if not grid:
+            params = entry.get("params", {})
+            name = entry.get("name") or "_".join(f"{k}-{v}" for k, v in params.items())
+            variants.append({**entry, "name": name or "default", "params": params})
+            continue
+
+        keys = list(grid)
+        for values in itertools.product(*(grid[k] for k in keys)):
+            params = {**entry.get("params", {}), **dict(zip(keys, values))}
+            name = "_".join(f"{k}-{v}" for k, v in zip(keys, values))
+            variants.append({"module": entry["module"], "scene": entry["scene"], "name": name, "params": params})
+    return variants
+
+
+def check_variants(variants):
+    """Fail on unknown scenes or parameters before anything imports manim"""
+    for variant in variants:
+        info = scene_info(variant["module"], variant["scene"])
+        unknown = set(variant["params"]) - set(info["params"])
+        if unknown:
+            raise ValueError(f"Unknown parameters for {variant['scene']}: {', '.join(sorted(unknown))}")
+
+
+def warm_up(module_names):
+    """Import manim and the scene modules once per process"""
+    importlib.import_module("manim")
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+
+def scene_kwargs(scene_cls, params):
+    """Constructor arguments: plain scenes (LatexTest, ...) take no params"""
+    return {"params": params} if issubclass(scene_cls, ParametrizedScene) else {}
+
+
+def render_variant(variant, quality):
+    """Render one variant, returns the movie path"""
+    from manim import tempconfig
+
+    module = importlib.import_module(variant["module"])
+    scene_cls = getattr(module, variant["scene"])
+    options = {
+        "quality": quality,
+        "output_file": f"{variant['scene']}_{variant['name']}",
+        "preview": False,
+    }
+    with tempconfig(options):
+        scene = scene_cls(**scene_kwargs(scene_cls, variant["params"]))
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render parameter variants of scenes in one warm process")
+    parser.add_argument("variants_file")
+    parser.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes (forked after warm-up)")
+    args = parser.parse_args()
+
+    with open(args.variants_file, "r", encoding="utf-8") as f:
+        variants = expand_variants(json.load(f))
+    check_variants(variants)
+    quality = QUALITY_FLAGS[args.quality]
+    modules = sorted({v["module"] for v in variants})
+    warm_up(modules)
+
+    # Every formula of the batch in one TeX run, before any scene needs it
+    from tex_batch import precompile_tex, scene_formulas
+
+    precompile_tex(scene_formulas(dict.fromkeys((v["module"], v["scene"]) for v in variants)))
+
+    if args.jobs <= 1:
+        for variant in variants:
+            path = render_variant(variant, quality)
+            print(f"{variant['scene']} [{variant['name']}]: {path}")
+        return
+
+    # Forked workers inherit the already imported modules
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+    with ProcessPoolExecutor(args.jobs, mp_context=context, initializer=warm_up, initargs=(modules,)) as pool:
+        futures = [(v, pool.submit(render_variant, v, quality)) for v in variants]
+        for variant, future in futures:
+            print(f"{variant['scene']} [{variant['name']}]: {future.result()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+MathCLI Pro - Scene Catalog
+Lists the manim scene classes defined in the animation modules.
+
+The index is built by reading the sources with `ast`, so listing scenes,
+docstrings, PARAMS and literal MathTex / Tex strings never imports manim.
+It is cached in __pycache__/scene_index.json and a module is only
+re-parsed when its mtime or size changes. Scene modules (and manim) are
+imported only by load_scene / find_scenes, i.e. when something is actually
+rendered.
+
+Run:
+    python scene_catalog.py                  # every module
+    python scene_catalog.py numerology_v3    # one module
+"""
+
+import ast
+import importlib
+import json
+import sys
+from pathlib import Path
+
+# Modules rendered as part of a numerology content batch
+SCENE_MODULES = ["numerology_animations", "numerology_v2", "numerology_v3"]
+
+# Everything the catalog lists
+ALL_MODULES = SCENE_MODULES + ["binance_risk", "latex_test"]
+
+ROOT = Path(__file__).resolve().parent
+INDEX_PATH = ROOT / "__pycache__" / "scene_index.json"
+INDEX_VERSION = 2
+
+# TeX mobject classes: (argument separator, default environment)
+TEX_CLASSES = {"MathTex": (" ", "align*"), "Tex": ("", "center")}
+
+# Keywords that change how the strings are split or compiled
+TEX_UNSUPPORTED_KEYWORDS = {"arg_separator", "substrings_to_isolate", "tex_to_color_map", "tex_template"}
+
+
+def base_name(node):
+    """Name of a base class expression (Scene, manim.Scene, ...)"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def class_params(node):
+    """Literal PARAMS = {...} of a class body, {} when absent or not literal"""
+    for stmt in node.body:
+        if isinstance(stmt, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "PARAMS" for target in stmt.targets
+        ):
+            try:
+                return ast.literal_eval(stmt.value)
+            except ValueError:
+                return {}
+    return {}
+
+
+def literal_strings(node, bindings):
+    """Strings a literal (or a name bound to a literal list) evaluates to"""
+    if isinstance(node, ast.Name) and node.id in bindings:
+        return bindings[node.id]
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        return None
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, (list, tuple)) and all(isinstance(v, str) for v in value):
+        return list(value)
+    return None
+
+
+def tex_call(call, bindings):
+    """[(expression, environment)] of one MathTex(...) / Tex(...) call"""
+    separator, environment = TEX_CLASSES[call.func.id]
+    if any(kw.arg in TEX_UNSUPPORTED_KEYWORDS or kw.arg is None for kw in call.keywords):
+        return []
+    for kw in call.keywords:
+        if kw.arg == "tex_environment":
+            environment = literal_strings(kw.value, {})
+            if environment is None or len(environment) != 1:
+                return []
+            environment = environment[0]
+    if not call.args or any(isinstance(arg, ast.Starred) for arg in call.args):
+        return []
+
+    # Each argument may expand to several strings (comprehension variables)
+    choices = [literal_strings(arg, bindings) for arg in call.args]
+    if any(choice is None for choice in choices):
+        return []
+    if len(call.args) > 1 and any(len(choice) != 1 for choice in choices):
+        return []
+    if len(call.args) == 1:
+        expressions = choices[0]
+    else:
+        expressions = [separator.join(choice[0] for choice in choices)]
+    # "{{ }}" splits the string into parts: leave those to manim
+    return [(expression, environment) for expression in expressions if "{{" not in expression]
+
+
+def class_tex(node):
+    """Literal TeX strings typeset by a class body, without duplicates"""
+    found = []
+    for function in ast.walk(node):
+        if not isinstance(function, ast.FunctionDef):
+            continue
+        # Names bound to literal string lists in this method
+        bindings = {}
+        for stmt in ast.walk(function):
+            if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
+                strings = literal_strings(stmt.value, {})
+                if strings is not None and not isinstance(stmt.value, ast.Constant):
+                    bindings[stmt.targets[0].id] = strings
+            elif isinstance(stmt, (ast.ListComp, ast.GeneratorExp, ast.SetComp)):
+                for generator in stmt.generators:
+                    strings = literal_strings(generator.iter, bindings)
+                    if strings is not None and isinstance(generator.target, ast.Name):
+                        bindings[generator.target.id] = strings
+        for call in ast.walk(function):
+            if isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id in TEX_CLASSES:
+                for item in tex_call(call, bindings):
+                    if list(item) not in found:
+                        found.append(list(item))
+    return found
+
+
+def scan_module(path):
+    """Scene classes of one source file, in source order"""
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    scenes = []
+    scene_names = set()
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = [base_name(base) for base in node.bases]
+        # A scene derives from some manim *Scene, or from a scene defined above
+        if not any(b and ((b.endswith("Scene") and b != "ParametrizedScene") or b in scene_names) for b in bases):
+            continue
+        scene_names.add(node.name)
+        scenes.append({
+            "name": node.name,
+            "line": node.lineno,
+            "bases": [b for b in bases if b],
+            "doc": ast.get_docstring(node) or "",
+            "params": class_params(node),
+            "tex": class_tex(node),
+        })
+    return scenes
+
+
+def load_index():
+    try:
+        with open(INDEX_PATH, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return index.get("modules", {}) if index.get("version") == INDEX_VERSION else {}
+
+
+def save_index(modules):
+    INDEX_PATH.parent.mkdir(exist_ok=True)
+    tmp = INDEX_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"version": INDEX_VERSION, "modules": modules}), encoding="utf-8")
+    tmp.replace(INDEX_PATH)
+
+
+def scene_index(module_names=None):
+    """{module_name: [scene entries]}, re-parsing only modules that changed"""
+    cached = load_index()
+    result = {}
+    changed = False
+    for module_name in module_names or ALL_MODULES:
+        path = ROOT / f"{module_name}.py"
+        stat = path.stat()
+        entry = cached.get(module_name)
+        if not entry or entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "scenes": scan_module(path)}
+            cached[module_name] = entry
+            changed = True
+        result[module_name] = entry["scenes"]
+    if changed:
+        save_index(cached)
+    return result
+
+
+def scene_info(module_name, scene_name):
+    """Index entry of one scene (docstring, PARAMS, ...) without importing it"""
+    for scene in scene_index([module_name])[module_name]:
+        if scene["name"] == scene_name:
+            return scene
+    raise ValueError(f"No scene {scene_name} in {module_name}")
+
+
+def load_scene(module_name, scene_name):
+    """Import the module (and manim) and return the scene class"""
+    scene_info(module_name, scene_name)
+    return getattr(importlib.import_module(module_name), scene_name)
+
+
+def find_scenes(module_name):
+    """Return (name, class) pairs for every Scene defined in a module"""
+    # Source order comes from the index so contact sheets follow the file
+    module = importlib.import_module(module_name)
+    return [(scene["name"], getattr(module, scene["name"])) for scene in scene_index([module_name])[module_name]]
+
+
+def iter_scenes(module_names=None):
+    """Yield (module_name, scene_name, class) over several modules"""
+    for module_name in module_names or SCENE_MODULES:
+        for name, cls in find_scenes(module_name):
+            yield module_name, name, cls
+
+
+if __name__ == "__main__":
+    for module_name, scenes in scene_index(sys.argv[1:] or None).items():
+        print(f"{module_name}.py")
+        for scene in scenes:
+            summary = scene["doc"].splitlines()[0] if scene["doc"] else ""
+            print(f"  {scene['name']:<28} {summary}")
+            for key, value in scene["params"].items():
+                print(f"      {key} = {value!r}")
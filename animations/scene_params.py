@@ -0,0 +1,63 @@
+"""
+MathCLI Pro - Scene Parameters
+Lets scene classes take their range, scale, colors and timing from data
+instead of hard-coded constants.
+
+Resolution order (later wins):
+    1. the scene class PARAMS defaults
+    2. the JSON file named by the SCENE_PARAMS environment variable,
+       e.g. {"UlamSpiralDetailed": {"n_max": 900}}
+    3. params=... passed to the scene constructor (used by render_variants.py)
+"""
+
+import json
+import os
+
+PARAMS_ENV = "SCENE_PARAMS"
+
+
+def load_params_file(path=None):
+    """Read per-scene overrides from JSON, {} when no file is configured"""
+    path = path or os.getenv(PARAMS_ENV)
+    if not path:
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def resolve_params(scene_cls, overrides=None):
+    """Merge defaults, file overrides and explicit overrides for one scene"""
+    params = dict(scene_cls.PARAMS)
+    for source in (load_params_file().get(scene_cls.__name__, {}), overrides or {}):
+        unknown = set(source) - set(params)
+        if unknown:
+            raise ValueError(
+                f"Unknown parameters for {scene_cls.__name__}: {', '.join(sorted(unknown))}"
+            )
+        params.update(source)
+    return params
+
+
+def resolve_color(value):
+    """Accept manim color names ("BLUE", "GOLD") as well as hex strings"""
+    if isinstance(value, str) and not value.startswith("#"):
+        import manim
+
+        return getattr(manim, value.upper())
+    return value
+
+
+class ParametrizedScene:
+    """
+    Scene mixin exposing self.params
+    Usage: class UlamSpiral(ParametrizedScene, MovingCameraScene) with PARAMS = {...}
+    """
+
+    PARAMS = {}
+
+    def __init__(self, *args, params=None, **kwargs):
+        self.params = resolve_params(type(self), params)
+        super().__init__(*args, **kwargs)
+
+    def color(self, key):
+        return resolve_color(self.params[key])
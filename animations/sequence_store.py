@@ -0,0 +1,257 @@
+"""
+MathCLI Pro - Sequence Store
+Prime / Fibonacci tables computed once per machine and memory-mapped
+read-only by every render process.
+
+Files live in $SEQUENCE_STORE (default ~/.cache/mathcli-pro/sequences):
+    manifest.json          format version + sieve limit
+    prime_bits.v1.npy      packed bitset, bit k set iff k is prime
+    primes.v1.npy          all primes <= limit (uint32 / uint64)
+    spf.v1.npy             smallest prime factor of every k <= limit
+    fibonacci.v1.npy       F(0)..F(93), everything that fits in uint64
+    fib_mod.v1.npz         one Pisano period of F(n) mod m per modulus
+
+Every file is written to a temporary name and renamed into place, so
+parallel workers never map a half-written table, and builds hold an
+exclusive lock on .lock (flock, msvcrt on Windows), so two processes growing the store at once cannot
+leave a manifest that does not match the tables.
+
+Run:
+    python sequence_store.py build 100000000
+    python sequence_store.py info
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+FORMAT_VERSION = 1
+DEFAULT_LIMIT = 10_000_000
+FIB_MODULI = (9, 10, 12, 100, 1000)
+
+STORE_ENV = "SEQUENCE_STORE"
+
+
+def default_root():
+    root = os.getenv(STORE_ENV)
+    if root:
+        return Path(root)
+    return Path.home() / ".cache" / "mathcli-pro" / "sequences"
+
+
+def sieve_spf(limit):
+    """Smallest prime factor table for 0..limit (spf[p] == p for primes)"""
+    dtype = np.uint32 if limit < 2 ** 32 else np.uint64
+    spf = np.zeros(limit + 1, dtype=dtype)
+    for p in range(2, int(np.sqrt(limit)) + 1):
+        if spf[p]:
+            continue
+        multiples = spf[p * p::p]
+        multiples[multiples == 0] = p
+    unset = np.flatnonzero(spf == 0)
+    spf[unset] = unset
+    spf[:2] = 0
+    return spf
+
+
+def fibonacci_table():
+    """F(0)..F(93) as uint64"""
+    fib = [0, 1]
+    while len(fib) < 94:
+        fib.append(fib[-1] + fib[-2])
+    return np.array(fib, dtype=np.uint64)
+
+
+def pisano_residues(m):
+    """F(n) mod m over one Pisano period"""
+    residues = [0, 1]
+    while True:
+        residues.append((residues[-1] + residues[-2]) % m)
+        if residues[-2:] == [0, 1]:
+            return np.array(residues[:-2], dtype=np.uint16)
+
+
+def atomic_save(path, writer):
+    """Write through a temp file in the same directory, then rename"""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=path.suffix)
+    os.close(fd)
+    try:
+        writer(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+class SequenceStore:
+    """Read-only view over the on-disk tables, building them when missing"""
+
+    def __init__(self, root=None):
+        self.root = Path(root) if root else default_root()
+        self.manifest_path = self.root / "manifest.json"
+        self._maps = {}
+        self._mapped_limit = 0
+
+    def path(self, name, suffix=".npy"):
+        return self.root / f"{name}.v{FORMAT_VERSION}{suffix}"
+
+    @property
+    def limit(self):
+        """Sieve limit of the current build, 0 when nothing is built"""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if manifest.get("version") != FORMAT_VERSION:
+            return 0
+        return manifest["limit"]
+
+    @contextmanager
+    def locked(self):
+        """Exclusive lock on the store, held while tables are written"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / ".lock", "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            else:
+                # msvcrt locks a byte range and gives up after ~10 s: retry
+                while True:
+                    try:
+                        msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        time.sleep(0.1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+                else:
+                    lock.seek(0)
+                    msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def build(self, limit=DEFAULT_LIMIT):
+        """Compute and write every table up to `limit`"""
+        with self.locked():
+            self.write_tables(limit)
+
+    def write_tables(self, limit):
+        """Unlocked part of build(): callers hold locked()"""
+        spf = sieve_spf(limit)
+        mask = np.zeros(limit + 1, dtype=bool)
+        mask[2:] = spf[2:] == np.arange(2, limit + 1, dtype=spf.dtype)
+        primes = np.flatnonzero(mask).astype(spf.dtype)
+
+        atomic_save(self.path("spf"), lambda tmp: np.save(tmp, spf))
+        atomic_save(self.path("primes"), lambda tmp: np.save(tmp, primes))
+        atomic_save(
+            self.path("prime_bits"),
+            lambda tmp: np.save(tmp, np.packbits(mask, bitorder="little")),
+        )
+        atomic_save(self.path("fibonacci"), lambda tmp: np.save(tmp, fibonacci_table()))
+        atomic_save(
+            self.path("fib_mod", ".npz"),
+            lambda tmp: np.savez(tmp, **{str(m): pisano_residues(m) for m in FIB_MODULI}),
+        )
+
+        # Manifest last: readers only trust tables once it exists
+        manifest = json.dumps({"version": FORMAT_VERSION, "limit": limit})
+        atomic_save(self.manifest_path, lambda tmp: Path(tmp).write_text(manifest))
+
+    def ensure(self, n):
+        """Make sure tables cover 0..n, growing the build if needed"""
+        if 0 < n <= self._mapped_limit:
+            return
+        current = self.limit
+        if current < max(n, 1):
+            with self.locked():
+                # Another process may have grown the store while we waited
+                current = self.limit
+                if current < max(n, 1):
+                    self.write_tables(max(n, DEFAULT_LIMIT, 2 * current))
+                    current = self.limit
+        if current != self._mapped_limit:
+            # Another process (or we) rebuilt the tables: remap
+            self._maps.clear()
+            self._mapped_limit = current
+
+    def table(self, name):
+        """Memory-mapped table (shared page cache across processes)"""
+        if name not in self._maps:
+            self._maps[name] = np.load(self.path(name), mmap_mode="r")
+        return self._maps[name]
+
+    def prime_mask(self, n):
+        """Boolean array, mask[k] True iff k is prime, 0 <= k <= n"""
+        self.ensure(n)
+        bits = self.table("prime_bits")[: n // 8 + 1]
+        return np.unpackbits(bits, bitorder="little")[: n + 1].astype(bool)
+
+    def is_prime(self, k):
+        self.ensure(k)
+        return bool(self.table("prime_bits")[k >> 3] >> (k & 7) & 1)
+
+    def primes(self, n):
+        """All primes <= n, a read-only slice of the mapped list"""
+        self.ensure(n)
+        primes = self.table("primes")
+        return primes[: np.searchsorted(primes, n, side="right")]
+
+    def spf(self, n):
+        self.ensure(n)
+        return self.table("spf")[: n + 1]
+
+    def factorize(self, k):
+        """Prime factors of k (with multiplicity) by walking the SPF table"""
+        spf = self.spf(k)
+        factors = []
+        while k > 1:
+            p = int(spf[k])
+            factors.append(p)
+            k //= p
+        return factors
+
+    def fibonacci(self, count):
+        """First `count` Fibonacci numbers (count <= 94)"""
+        self.ensure(0)
+        return self.table("fibonacci")[:count]
+
+    def fib_residues(self, m):
+        """One Pisano period of F(n) mod m"""
+        self.ensure(0)
+        if "fib_mod" not in self._maps:
+            self._maps["fib_mod"] = np.load(self.path("fib_mod", ".npz"))
+        return self._maps["fib_mod"][str(m)]
+
+
+_store = None
+
+
+def get_store():
+    """Process-wide store instance"""
+    global _store
+    if _store is None:
+        _store = SequenceStore()
+    return _store
+
+
+if __name__ == "__main__":
+    store = get_store()
+    command = sys.argv[1] if len(sys.argv) > 1 else "info"
+    if command == "build":
+        limit = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_LIMIT
+        store.build(limit)
+    print(f"Sequence store: {store.root} (limit {store.limit:,})")
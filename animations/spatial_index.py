@@ -0,0 +1,191 @@
+"""
+MathCLI Pro - Spatial Index & Off-Frame Culling
+Lets deep zooms on large scenes cost roughly what is visible.
+
+While a MovingCameraScene zooms, manim treats every mobject as moving and
+hands all of them to cairo on every frame, even the ones far outside the
+frame. CullingCamera keeps a uniform grid over the bounding boxes of the
+displayed mobjects and, on each frame, only returns the ones that overlap
+the visible frame and are at least a fraction of a pixel wide.
+
+The grid is rebuilt lazily once per play (CullingMixin resets it in
+begin_animations). A top-level mobject whose family holds a mobject
+animated by the current play, or a mobject with an updater, can move or
+change its submobjects during it: it stays out of the grid, and its family
+is expanded again and drawn whole on every frame.
+"""
+
+import numpy as np
+from manim.camera.moving_camera import MovingCamera
+
+from tiled_raster import TileRasterizer
+
+# Average number of mobjects per grid cell, and a cap on the grid size
+CELL_OCCUPANCY = 4
+MAX_CELLS_PER_SIDE = 512
+
+# Kept around the frame so strokes and antialiasing at the edge are not cut
+CULL_MARGIN = 0.1
+
+
+class SpatialGrid:
+    """Uniform grid over the 2D bounding boxes of a list of mobjects"""
+
+    def __init__(self, mobjects, dynamic=None):
+        self.mobjects = list(mobjects)
+        n = len(self.mobjects)
+        dynamic = np.zeros(n, dtype=bool) if dynamic is None else np.asarray(dynamic, dtype=bool)
+        self.dynamic = np.flatnonzero(dynamic)
+
+        # Bounding boxes of every mobject with one reduceat over all points
+        if n:
+            lengths = np.array([len(m.points) for m in self.mobjects])
+            offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+            points = np.concatenate([m.points[:, :2] for m in self.mobjects])
+            self.lo = np.minimum.reduceat(points, offsets)
+            self.hi = np.maximum.reduceat(points, offsets)
+        else:
+            self.lo = self.hi = np.zeros((0, 2))
+        self.extent = (self.hi - self.lo).max(axis=1) if n else np.zeros(0)
+
+        static = np.flatnonzero(~dynamic)
+        span_lo = self.lo[static].min(axis=0) if len(static) else np.zeros(2)
+        span_hi = self.hi[static].max(axis=0) if len(static) else np.zeros(2)
+        cells = int(np.clip(np.sqrt(len(static) / CELL_OCCUPANCY), 1, MAX_CELLS_PER_SIDE))
+        self.origin = span_lo
+        self.cell = max((span_hi - span_lo).max() / cells, 1e-9)
+        self.nx, self.ny = (int(k) + 1 for k in np.floor((span_hi - span_lo) / self.cell))
+
+        # Mobjects larger than a cell are always tested; the small ones are
+        # bucketed by the cell of their center (CSR layout: order + starts)
+        small = self.extent[static] <= self.cell
+        self.large = static[~small]
+        small = static[small]
+        cx, cy = self.cell_coords((self.lo[small] + self.hi[small]) / 2)
+        cell_id = cy * self.nx + cx
+        order = np.argsort(cell_id, kind="stable")
+        self.order = small[order]
+        self.starts = np.searchsorted(cell_id[order], np.arange(self.nx * self.ny + 1))
+        self.pad = self.extent[small].max() / 2 if len(small) else 0.0
+
+    def cell_coords(self, xy):
+        cells = np.floor((np.atleast_2d(xy) - self.origin) / self.cell).astype(int)
+        return np.clip(cells[:, 0], 0, self.nx - 1), np.clip(cells[:, 1], 0, self.ny - 1)
+
+    def query(self, x0, y0, x1, y1, min_extent=0.0):
+        """Indices of static mobjects overlapping the rectangle"""
+        (cx0, cx1), (cy0, cy1) = self.cell_coords([[x0 - self.pad, y0 - self.pad], [x1 + self.pad, y1 + self.pad]])
+        parts = [
+            self.order[self.starts[row * self.nx + cx0]:self.starts[row * self.nx + cx1 + 1]]
+            for row in range(cy0, cy1 + 1)
+        ]
+        candidates = np.concatenate(parts + [self.large])
+        lo, hi = self.lo[candidates], self.hi[candidates]
+        keep = (
+            (lo[:, 0] <= x1) & (hi[:, 0] >= x0) & (lo[:, 1] <= y1) & (hi[:, 1] >= y0)
+            & (self.extent[candidates] >= min_extent)
+        )
+        return candidates[keep]
+
+    def visible_indices(self, center, width, height, min_extent=0.0):
+        """Indices of the visible mobjects plus every dynamic one, in order"""
+        half_w = width / 2 + CULL_MARGIN
+        half_h = height / 2 + CULL_MARGIN
+        hits = self.query(center[0] - half_w, center[1] - half_h, center[0] + half_w, center[1] + half_h, min_extent)
+        return np.sort(np.concatenate([hits, self.dynamic]))
+
+    def visible(self, center, width, height, min_extent=0.0):
+        """Visible mobjects plus every dynamic one, in the original order"""
+        return [self.mobjects[i] for i in self.visible_indices(center, width, height, min_extent)]
+
+
+class CullingCamera(TileRasterizer, MovingCamera):
+    """MovingCamera that skips off-frame and sub-pixel mobjects (and draws in tiles)"""
+
+    # Static mobjects narrower than this many pixels are skipped (0 disables)
+    min_pixel_extent = 0.25
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.grids = {}
+        self.animations = []
+
+    def reset_spatial_index(self, animations=()):
+        self.grids = {}
+        self.animations = list(animations)
+
+    def dynamic_mask(self, mobjects):
+        """
+        Top-level mobjects that can change during the play: an animated
+        mobject or an updater anywhere in their family (an updater on a
+        parent moves all of its children)
+        """
+        animated = {
+            id(m)
+            for animation in self.animations if animation.mobject is not None
+            for m in animation.mobject.get_family()
+        }
+        return np.array([
+            any(id(m) in animated or m.updaters for m in mobject.get_family())
+            for mobject in mobjects
+        ], dtype=bool)
+
+    def build_index(self, mobjects):
+        """Grid over the static families, with the top-level owner of each member"""
+        dynamic = self.dynamic_mask(mobjects)
+        members, owners = [], []
+        for i, mobject in enumerate(mobjects):
+            if not dynamic[i]:
+                family = mobject.family_members_with_points()
+                members.extend(family)
+                owners.extend([i] * len(family))
+        # Keep the last occurrence of shared members, like manim
+        seen, keep = set(), []
+        for j in range(len(members) - 1, -1, -1):
+            if members[j] not in seen:
+                seen.add(members[j])
+                keep.append(j)
+        keep.reverse()
+        members = [members[j] for j in keep]
+        owners = np.array(owners, dtype=int)[keep]
+        return SpatialGrid(members), owners, np.flatnonzero(dynamic)
+
+    def get_mobjects_to_display(self, mobjects, include_submobjects=True, excluded_mobjects=None):
+        mobjects = list(mobjects)
+        if not include_submobjects or excluded_mobjects:
+            return super().get_mobjects_to_display(mobjects, include_submobjects, excluded_mobjects)
+
+        key = tuple(map(id, mobjects))
+        index = self.grids.get(key)
+        if index is None:
+            index = self.grids[key] = self.build_index(mobjects)
+        grid, owners, dynamic = index
+
+        min_extent = self.min_pixel_extent * self.frame_width / self.pixel_width
+        hits = grid.visible_indices(self.frame_center, self.frame_width, self.frame_height, min_extent)
+        # Dynamic families are expanded on every frame, in their place in the scene order
+        parts = np.split(hits, np.searchsorted(owners[hits], dynamic))
+        visible = [grid.mobjects[i] for i in parts[0]]
+        for owner, part in zip(dynamic, parts[1:]):
+            visible.extend(mobjects[owner].family_members_with_points())
+            visible.extend(grid.mobjects[i] for i in part)
+        if self.use_z_index:
+            visible.sort(key=lambda m: m.z_index)
+        return visible
+
+
+class CullingMixin:
+    """
+    Scene mixin using CullingCamera and keeping its index fresh
+    Usage: class UlamSpiral(ParametrizedScene, CullingMixin, StaticHoldMixin, MovingCameraScene)
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("camera_class", CullingCamera)
+        super().__init__(*args, **kwargs)
+
+    def begin_animations(self):
+        super().begin_animations()
+        camera = self.renderer.camera
+        if isinstance(camera, CullingCamera):
+            camera.reset_spatial_index(self.animations)
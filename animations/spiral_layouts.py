@@ -0,0 +1,137 @@
+"""
+MathCLI Pro - Prime Spiral Layouts
+One vectorized engine for every "arrange the integers, light up the primes"
+picture: each layout maps an int array n >= 1 to (x, y) float arrays, and
+the prime mask, scaling and point-cloud construction are shared.
+
+Layouts:
+    ulam        square spiral (Ulam)
+    sacks       Archimedean spiral, r = sqrt(n), one turn per perfect square
+    hexagonal   hexagonal rings of 6k numbers around 1
+    klauber     Klauber triangle, row r holds (r-1)^2 + 1 .. r^2
+    wheel:m     modular wheel, spoke n mod m at radius n // m (default m = 6)
+
+Run:
+    python spiral_layouts.py sacks 1000000
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from number_theory import prime_sieve, ulam_coords_array
+
+SQRT3_2 = np.sqrt(3) / 2
+HEX_DIRECTIONS = np.array([[np.cos(a), np.sin(a)] for a in np.arange(6) * np.pi / 3])
+
+
+def ulam_layout(n):
+    x, y = ulam_coords_array(n)
+    return x.astype(float), y.astype(float)
+
+
+def sacks_layout(n):
+    """Polar (sqrt(n), 2*pi*sqrt(n)): squares line up on the positive x-axis"""
+    r = np.sqrt(np.asarray(n, dtype=float))
+    theta = 2 * np.pi * r
+    return r * np.cos(theta), r * np.sin(theta)
+
+
+def hexagonal_layout(n):
+    """Ring k >= 1 holds 6k numbers, walked edge by edge without gaps"""
+    m = np.asarray(n, dtype=np.int64) - 1
+    k = np.ceil((np.sqrt(9 + 12 * m) - 3) / 6).astype(np.int64)
+    ring = np.maximum(k, 1)
+    # Start each ring one step past its first corner so rings join up
+    q = (m - 3 * k * (k - 1)) % (6 * ring)
+    side, step = q // ring, q % ring
+    corner = HEX_DIRECTIONS[side] * k[:, None]
+    xy = corner + HEX_DIRECTIONS[(side + 2) % 6] * step[:, None]
+    return xy[:, 0], xy[:, 1]
+
+
+def klauber_layout(n):
+    """Row r is centred under row r - 1, rows sqrt(3)/2 apart"""
+    n = np.asarray(n, dtype=np.int64)
+    r = np.ceil(np.sqrt(n)).astype(np.int64)
+    i = n - (r - 1) ** 2 - 1
+    return (i - (r - 1)).astype(float), -(r - 1) * SQRT3_2
+
+
+def modular_wheel(modulus=6):
+    """Layout with one spoke per residue class mod `modulus`"""
+    def wheel_layout(n):
+        n = np.asarray(n, dtype=np.int64)
+        theta = 2 * np.pi * (n % modulus) / modulus
+        r = (n // modulus).astype(float)
+        return r * np.cos(theta), r * np.sin(theta)
+    return wheel_layout
+
+
+LAYOUTS = {
+    "ulam": ulam_layout,
+    "sacks": sacks_layout,
+    "hexagonal": hexagonal_layout,
+    "klauber": klauber_layout,
+    "wheel": modular_wheel(),
+}
+
+
+def get_layout(name):
+    """Layout function by name, "wheel:30" picks the modulus"""
+    if callable(name):
+        return name
+    base, _, arg = name.partition(":")
+    if base == "wheel" and arg:
+        return modular_wheel(int(arg))
+    if base not in LAYOUTS:
+        raise ValueError(f"Unknown layout '{name}', expected one of {sorted(LAYOUTS)}")
+    return LAYOUTS[base]
+
+
+def layout_points(layout, n_max, scale=1.0, primes_only=True, center=True):
+    """
+    (points, numbers) for 1..n_max under `layout`: points is an (N, 3)
+    float array ready for manim, numbers the integers they stand for
+    """
+    numbers = np.arange(1, n_max + 1, dtype=np.int64)
+    if primes_only:
+        numbers = numbers[prime_sieve(n_max)[1:]]
+    x, y = get_layout(layout)(numbers)
+
+    points = np.zeros((len(numbers), 3))
+    points[:, 0] = x
+    points[:, 1] = y
+    points *= scale
+    if center and len(points):
+        points -= (points.min(axis=0) + points.max(axis=0)) / 2
+    return points, numbers
+
+
+def fit_scale(points, width, height):
+    """Scale factor that fits unit-scale points into a width x height box"""
+    span = np.ptp(points[:, :2], axis=0) if len(points) else np.zeros(2)
+    return min(width / max(span[0], 1e-9), height / max(span[1], 1e-9))
+
+
+def prime_cloud(layout, n_max, color, width=12, height=6, stroke_width=2):
+    """
+    All primes <= n_max as a single PMobject point cloud, fitted into
+    width x height: one mobject however large n_max is
+    """
+    from manim import PMobject
+
+    points, _ = layout_points(layout, n_max)
+    cloud = PMobject(stroke_width=stroke_width)
+    cloud.add_points(points * fit_scale(points, width, height), color=color)
+    return cloud
+
+
+if __name__ == "__main__":
+    name = sys.argv[1] if len(sys.argv) > 1 else "sacks"
+    n_max = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    start = time.perf_counter()
+    points, numbers = layout_points(name, n_max)
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {len(numbers):,} primes <= {n_max:,} laid out in {elapsed * 1000:.0f} ms")
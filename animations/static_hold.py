@@ -0,0 +1,79 @@
+"""
+MathCLI Pro - Static Segment Encoding
+Encodes held (unchanging) frames once instead of once per video frame.
+
+manim already rasterizes a static self.wait() only once, but it still hands
+duration * fps copies of that frame to the encoder. The writer below
+collapses every run of identical frames (static waits, and plays whose
+frames stop changing) into its first and last frame with explicit
+timestamps, so the partial movie files become variable frame rate.
+"""
+
+import av
+import numpy as np
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+
+
+class HoldFrameFileWriter(SceneFileWriter):
+    """SceneFileWriter that writes runs of identical frames as one hold"""
+
+    def open_partial_movie_stream(self, file_path=None):
+        # Reset before the writer thread starts consuming frames
+        self.next_pts = 0
+        self.held_frame = None
+        self.held_count = 0
+        super().open_partial_movie_stream(file_path)
+
+    def listen_and_write(self):
+        super().listen_and_write()
+        # Runs on the writer thread once the queue is drained
+        self.flush_held_frame()
+
+    def encode_and_write_frame(self, frame, num_frames):
+        if self.held_frame is not None and np.array_equal(frame, self.held_frame):
+            self.held_count += num_frames
+            return
+        self.flush_held_frame()
+        self.held_frame = frame
+        self.held_count = num_frames
+
+    def flush_held_frame(self):
+        """Encode the pending run: first frame, plus last frame if held"""
+        if self.held_frame is None:
+            return
+        self.encode_at(self.held_frame, self.next_pts)
+        if self.held_count > 1:
+            self.encode_at(self.held_frame, self.next_pts + self.held_count - 1)
+        self.next_pts += self.held_count
+        self.held_frame = None
+        self.held_count = 0
+
+    def encode_at(self, frame, pts):
+        av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+        av_frame.pts = pts
+        av_frame.time_base = self.video_stream.codec_context.time_base
+        for packet in self.video_stream.encode(av_frame):
+            self.video_container.mux(packet)
+
+
+def use_hold_frame_writer(scene):
+    """Swap the scene's file writer, only for the PyAV based Cairo writer"""
+    if not isinstance(scene.renderer, CairoRenderer):
+        return
+    if not hasattr(SceneFileWriter, "encode_and_write_frame"):
+        return
+    scene.renderer.file_writer = HoldFrameFileWriter(
+        scene.renderer, type(scene).__name__
+    )
+
+
+class StaticHoldMixin:
+    """
+    Scene mixin enabling held-frame encoding
+    Usage: class PerfectNumbers(StaticHoldMixin, Scene)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        use_hold_frame_writer(self)
@@ -0,0 +1,174 @@
+"""
+MathCLI Pro - Streaming Render
+Pipes raw frames straight into one ffmpeg process per scene.
+
+The default writer encodes every play/wait into its own partial movie file
+and concatenates them at the end. For long high-resolution renders (Ulam,
+Fibonacci) this path instead keeps a single x264 encoder open for the whole
+scene. Frames go through a small bounded queue between the rasterizer
+(main thread) and the encoder feeder thread, so memory and disk usage stay
+flat however long the scene is. Presets are CPU-only x264 and tuned for
+speed per quality level.
+
+Run:
+    python stream_render.py numerology_v3 UlamSpiralDetailed -q h
+"""
+
+import argparse
+import queue
+import shutil
+import subprocess
+import threading
+
+import numpy as np
+from manim import config, tempconfig
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import write_to_movie
+
+from scene_catalog import find_scenes
+
+# quality: (x264 preset, crf)
+FAST_PRESETS = {
+    "low_quality": ("ultrafast", 28),
+    "medium_quality": ("superfast", 24),
+    "high_quality": ("veryfast", 21),
+    "production_quality": ("faster", 19),
+    "fourk_quality": ("faster", 19),
+}
+DEFAULT_PRESET = ("veryfast", 21)
+
+QUALITY_FLAGS = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+# Frames buffered between rasterizer and encoder (bounds peak memory)
+RING_SIZE = 8
+
+
+class StreamingFileWriter(SceneFileWriter):
+    """SceneFileWriter feeding a single persistent ffmpeg process"""
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.encoder = None
+        self.encoder_thread = None
+        self.encoder_error = None
+        self.ring = queue.Queue(maxsize=RING_SIZE)
+
+    def is_already_cached(self, hash_invocation):
+        # No partial files are written, a cache hit would drop its frames
+        return False
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if write_to_movie() and allow_write and self.encoder is None:
+            self.start_encoder()
+
+    def end_animation(self, allow_write=False):
+        # The stream stays open across animations
+        pass
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        if self.encoder is None:
+            return
+        # Blocks when the encoder falls behind, instead of growing memory
+        self.ring.put((np.ascontiguousarray(frame_or_renderer), num_frames))
+
+    def combine_to_movie(self):
+        if self.encoder is None:
+            return
+        self.stop_encoder()
+        self.print_file_ready_message(self.movie_file_path)
+
+    def start_encoder(self):
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError("ffmpeg was not found on PATH (needed for streaming render)")
+
+        preset, crf = FAST_PRESETS.get(config.quality, DEFAULT_PRESET)
+        command = [
+            ffmpeg, "-y", "-loglevel", "error",
+            "-f", "rawvideo",
+            "-pix_fmt", "rgba",
+            "-s", f"{config.pixel_width}x{config.pixel_height}",
+            "-r", str(config.frame_rate),
+            "-i", "-",
+            "-an",
+            "-c:v", "libx264", "-preset", preset, "-crf", str(crf),
+            "-pix_fmt", "yuv420p",
+            "-movflags", "+faststart",
+            str(self.movie_file_path),
+        ]
+        self.encoder = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self.encoder_thread = threading.Thread(target=self.feed_encoder, daemon=True)
+        self.encoder_thread.start()
+
+    def feed_encoder(self):
+        """Encoder thread: drain the ring into ffmpeg's stdin"""
+        stdin = self.encoder.stdin
+        while True:
+            item = self.ring.get()
+            if item is None:
+                break
+            if self.encoder_error is not None:
+                # Keep draining so the rasterizer never blocks on a dead encoder
+                continue
+            frame, num_frames = item
+            data = memoryview(frame).cast("B")
+            try:
+                for _ in range(num_frames):
+                    stdin.write(data)
+            except (BrokenPipeError, OSError) as e:
+                self.encoder_error = e
+        try:
+            stdin.close()
+        except OSError:
+            pass
+
+    def stop_encoder(self):
+        self.ring.put(None)
+        self.encoder_thread.join()
+        return_code = self.encoder.wait()
+        self.encoder = None
+        if self.encoder_error is not None or return_code != 0:
+            raise RuntimeError(
+                f"ffmpeg failed while encoding {self.movie_file_path} "
+                f"(exit code {return_code}, {self.encoder_error})"
+            )
+
+
+def use_streaming_writer(scene):
+    """Swap the scene's file writer for the streaming one (mp4 output only)"""
+    if config.transparent or config.movie_file_extension != ".mp4":
+        return
+    scene.renderer.file_writer = StreamingFileWriter(scene.renderer, type(scene).__name__)
+
+
+def render_streaming(scene_cls, quality="high_quality"):
+    """Render a scene through the streaming writer, returns the movie path"""
+    with tempconfig({"quality": quality, "disable_caching": True, "preview": False}):
+        scene = scene_cls()
+        use_streaming_writer(scene)
+        scene.render()
+        return scene.renderer.file_writer.movie_file_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render scenes through a single streaming encoder")
+    parser.add_argument("module")
+    parser.add_argument("scenes", nargs="*", help="scene names (default: all in module)")
+    parser.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="h")
+    args = parser.parse_args()
+
+    for scene_name, scene_cls in find_scenes(args.module):
+        if args.scenes and scene_name not in args.scenes:
+            continue
+        path = render_streaming(scene_cls, QUALITY_FLAGS[args.quality])
+        print(f"{args.module}.{scene_name}: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# Stress test pentru portofoliu: aplică o grilă de șocuri de preț tuturor
+# pozițiilor din binance-status.json (rezultatele lui calculate_risk) și arată
+# ce poziții se lichidează la fiecare nivel, plus impactul total asupra marjei.
+#
+# Șocurile pot fi corelate printr-o matrice de factori: fiecare scenariu dă
+# mișcarea factorilor (n_șocuri x n_factori), fiecare simbol are încărcările
+# lui pe factori, iar șocul simbolului = scenariu @ încărcări. Implicit există
+# un singur factor de piață cu încărcare 1 (toate simbolurile se mișcă la fel).
+# Totul e o singură operație broadcast pe (șocuri x poziții): 1000 x 1000 în ms.
+
+import json
+import sys
+import time
+
+import numpy as np
+
+STATUS_FILE = 'binance-status.json'
+DEFAULT_SHOCKS = np.linspace(-0.5, 0.5, 101)
+
+
+# Funcție pentru extragerea coloanelor numerice din pozițiile calculate
+def position_arrays(results):
+    def column(key, default=0.0):
+        return np.array([float(pos.get(key, default)) for pos in results])
+
+    entry = np.array([float(pos.get('entry_price', pos.get('entryPrice', 0))) for pos in results])
+    return {
+        'symbols': [pos['symbol'] for pos in results],
+        'is_long': np.array([pos['side'] == 'LONG' for pos in results]),
+        'price': column('current_price'),
+        'entry': entry,
+        'liquidation': column('liquidation_price'),
+        'quantity': column('quantity'),
+        'leverage': column('leverage', 1),
+    }
+
+
+# Funcție pentru șocurile pe simbol din scenarii pe factori
+def symbol_shocks(shocks, symbols, loadings=None):
+    shocks = np.asarray(shocks, dtype=float)
+    if shocks.ndim == 1:
+        shocks = shocks[:, None]
+    n_factors = shocks.shape[1]
+
+    loadings = loadings or {}
+    matrix = np.ones((len(symbols), n_factors)) if n_factors == 1 else np.zeros((len(symbols), n_factors))
+    for j, symbol in enumerate(symbols):
+        if symbol in loadings:
+            matrix[j] = np.atleast_1d(loadings[symbol])
+    return shocks @ matrix.T
+
+
+# Funcție pentru grila de stress (șocuri x poziții), complet vectorizată
+def stress_grid(results, shocks=DEFAULT_SHOCKS, loadings=None):
+    arrays = position_arrays(results)
+    shock = symbol_shocks(shocks, arrays['symbols'], loadings)
+
+    price = arrays['price']
+    liquidation = arrays['liquidation']
+    is_long = arrays['is_long']
+    quantity = arrays['quantity']
+
+    shocked = np.maximum(price * (1 + shock), 0)
+
+    # Același risc ca în calculate_risk, la prețul după șoc
+    safe_liquidation = np.where(liquidation > 0, liquidation, np.nan)
+    risk = np.where(is_long, shocked - liquidation, liquidation - shocked) / safe_liquidation
+
+    # Prețul de lichidare 0 înseamnă că poziția nu poate fi lichidată
+    liquidated = (liquidation > 0) & np.where(is_long, shocked <= liquidation, shocked >= liquidation)
+
+    # Impact pe marjă: PnL-ul suplimentar, sau toată marja + PnL-ul curent la lichidare
+    margin = np.abs(quantity) * arrays['entry'] / arrays['leverage']
+    unrealized = quantity * (price - arrays['entry'])
+    impact = np.where(liquidated, -(margin + unrealized), quantity * (shocked - price))
+
+    return {
+        'symbols': arrays['symbols'],
+        'shocks': np.asarray(shocks, dtype=float),
+        'symbol_shocks': shock,
+        'prices': shocked,
+        'risk': risk,
+        'liquidated': liquidated,
+        'margin_impact': impact,
+        'total_impact': impact.sum(axis=1),
+    }
+
+
+# Funcție pentru raportul pe nivel de șoc: cine se lichidează și impactul total
+def liquidation_report(grid):
+    report = []
+    for i, row in enumerate(grid['liquidated']):
+        report.append({
+            'shock': grid['shocks'][i].tolist(),
+            'liquidated': [s for s, hit in zip(grid['symbols'], row) if hit],
+            'total_margin_impact': float(grid['total_impact'][i]),
+        })
+    return report
+
+
+# Funcție principală
+def main(path=STATUS_FILE):
+    with open(path, 'r') as f:
+        results = json.load(f)['positions']
+
+    if not results:
+        print("Nu există poziții în binance-status.json.")
+        return
+
+    start = time.perf_counter()
+    grid = stress_grid(results)
+    elapsed = time.perf_counter() - start
+
+    for row in liquidation_report(grid)[::10]:
+        hit = ', '.join(row['liquidated']) or '-'
+        print(f"Șoc {row['shock']:+.0%}: lichidate {hit} | impact marjă {row['total_margin_impact']:,.2f} USDT")
+    print(f"Grilă {grid['risk'].shape[0]} șocuri x {grid['risk'].shape[1]} poziții în {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else STATUS_FILE)
@@ -0,0 +1,156 @@
+"""
+MathCLI Pro - Batched LaTeX Compilation
+Compiles every uncached MathTex / Tex string of one or more scenes in a
+single TeX run instead of one latex + dvisvgm process pair per formula.
+
+The strings come from the scene catalog (read from the sources with `ast`,
+see scene_catalog.class_tex). Each one is expanded exactly as manim would
+(same template, environment and special-string fixes), which gives the
+hash manim looks up in media/Tex. The missing ones are typeset as the
+pages of one document, `dvisvgm --page=1-` writes one SVG per page, and
+each page is renamed to <hash>.svg: MathTex then finds its SVG in the cache
+and skips compilation.
+
+The batch document uses the article class with one formula per page
+(standalone's preview mode only emits a single page). SVGMobject sizes and
+centers glyphs from their own outlines, so the page layout does not change
+the result. If anything goes wrong the batch is dropped and manim compiles
+the formulas one by one as usual.
+"""
+
+import os
+import shlex
+import subprocess
+
+from manim import config, logger
+from manim.mobject.text.tex_mobject import SingleStringMathTex
+from manim.utils.tex_file_writing import tex_hash
+
+try:
+    from manim.utils.tex_file_writing import make_tex_compilation_command
+except ImportError:
+    # manim < 0.19 builds the same command as one shell string
+    from manim.utils.tex_file_writing import tex_compilation_command
+
+    def make_tex_compilation_command(tex_compiler, output_format, tex_file, tex_dir):
+        argv = shlex.split(tex_compilation_command(tex_compiler, output_format, tex_file, tex_dir))
+        # Drop the trailing "> /dev/null" redirection
+        return argv[:argv.index(">")] if ">" in argv else argv
+
+from scene_catalog import ROOT, scene_info
+
+_BEGIN_DOCUMENT = r"\begin{document}"
+_END_DOCUMENT = r"\end{document}"
+
+# Bare instance used only for SingleStringMathTex's expression clean-up
+_EXPRESSION_FIXER = SingleStringMathTex.__new__(SingleStringMathTex)
+
+
+def tex_code(expression, environment, tex_template):
+    """Full document manim writes for one formula (its hash names the SVG)"""
+    # Same clean-up SingleStringMathTex applies before compiling
+    modified = _EXPRESSION_FIXER._get_modified_expression(expression)
+    return tex_template.get_texcode_for_expression_in_env(modified, environment)
+
+
+def missing_formulas(formulas, tex_template):
+    """{svg path: tex code} of the formulas without a cached SVG"""
+    tex_dir = config.get_dir("tex_dir")
+    missing = {}
+    for expression, environment in formulas:
+        code = tex_code(expression, environment, tex_template)
+        svg = tex_dir / f"{tex_hash(code)}.svg"
+        if not svg.exists():
+            missing[svg] = code
+    return missing
+
+
+def batch_document(codes, tex_template):
+    """One page per formula, sharing the template's preamble"""
+    head = codes[0].split(_BEGIN_DOCUMENT)[0].replace(tex_template.documentclass, "", 1)
+    pages = [code.split(_BEGIN_DOCUMENT, 1)[1].rsplit(_END_DOCUMENT, 1)[0] for code in codes]
+    return "\n".join([
+        r"\documentclass{article}",
+        head,
+        r"\pagestyle{empty}",
+        _BEGIN_DOCUMENT,
+        "\n\\clearpage\n".join(pages),
+        _END_DOCUMENT,
+    ])
+
+
+def compile_batch(missing, tex_template):
+    """Typeset all missing formulas at once and store one SVG per formula"""
+    tex_dir = config.get_dir("tex_dir")
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    codes = list(missing.values())
+    document = batch_document(codes, tex_template)
+    tex_file = tex_dir / f"batch_{tex_hash(document)}.tex"
+    tex_file.write_text(document, encoding="utf-8")
+
+    output_format = tex_template.output_format
+    try:
+        command = make_tex_compilation_command(tex_template.tex_compiler, output_format, tex_file, tex_dir)
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+        pattern = f"{tex_file.stem}-%p.svg"
+        command = ["dvisvgm", "--page=1-", "-n", "-v", "0", "-o", str(tex_dir / pattern), str(tex_file.with_suffix(output_format))]
+        if output_format == ".pdf":
+            command.insert(1, "--pdf")
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+        pages = sorted(tex_dir.glob(f"{tex_file.stem}-*.svg"), key=lambda path: int(path.stem.rsplit("-", 1)[1]))
+        if len(pages) != len(codes):
+            # A formula spilled onto a second page: the pages no longer line up
+            raise RuntimeError(f"expected {len(codes)} pages, got {len(pages)}")
+        for page, svg in zip(pages, missing):
+            os.replace(page, svg)
+        return len(pages)
+    finally:
+        if not config["no_latex_cleanup"]:
+            for path in tex_dir.glob(f"{tex_file.stem}*"):
+                path.unlink()
+
+
+def precompile_tex(formulas, tex_template=None):
+    """Compile the uncached (expression, environment) pairs in one TeX run"""
+    tex_template = tex_template or config["tex_template"]
+    missing = missing_formulas(formulas, tex_template)
+    # A fixed-body template has no preamble to share; one formula gains nothing
+    if len(missing) < 2 or tex_template._body:
+        return 0
+    try:
+        count = compile_batch(missing, tex_template)
+    except (OSError, RuntimeError, subprocess.CalledProcessError) as e:
+        logger.warning("Batched TeX compilation failed (%s), compiling formulas one by one", e)
+        return 0
+    logger.info("Compiled %d TeX formulas in one run", count)
+    return count
+
+
+def scene_formulas(scenes):
+    """Catalogued TeX strings of (module_name, scene_name) pairs"""
+    formulas = []
+    for module_name, scene_name in scenes:
+        if not (ROOT / f"{module_name}.py").exists():
+            continue
+        try:
+            info = scene_info(module_name, scene_name)
+        except ValueError:
+            continue
+        for item in info["tex"]:
+            if tuple(item) not in formulas:
+                formulas.append(tuple(item))
+    return formulas
+
+
+class TexPrepassMixin:
+    """
+    Scene mixin compiling the scene's TeX strings in one run before construct()
+    Usage: class LatexTest(TexPrepassMixin, Scene)
+    """
+
+    def setup(self):
+        super().setup()
+        scene_cls = type(self)
+        precompile_tex(scene_formulas([(scene_cls.__module__, scene_cls.__name__)]))
@@ -0,0 +1,114 @@
+"""
+MathCLI Pro - Tile-Parallel Rasterization
+Rasterizes the VMobjects of a frame on several threads.
+
+The frame is cut into horizontal strips. Each strip gets its own cairo
+surface created directly on its rows of the camera's pixel array (rows are
+contiguous, so nothing is copied or merged), and the strips are drawn on a
+thread pool. A mobject is drawn in every strip its bounding box (plus the
+stroke width) touches, in the original order, so every pixel is composited
+exactly as on a single surface. pycairo releases the GIL while filling and
+stroking, which is where dense frames at 1080p / 4K spend their time.
+
+RENDER_THREADS sets the number of threads (default: all cores, 1 disables).
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import cairo
+import numpy as np
+from manim.camera.camera import Camera
+
+RENDER_THREADS = int(os.getenv("RENDER_THREADS", os.cpu_count() or 1))
+
+# Strips per thread (uneven strips balance out), minimum strip height
+STRIPS_PER_THREAD = 4
+MIN_STRIP_HEIGHT = 16
+
+# Below this many VMobjects a batch is drawn on the calling thread
+MIN_PARALLEL_MOBJECTS = 64
+
+# cairo's default miter limit: how far a joint can stick out, in half widths
+MITER_LIMIT = 10
+
+# Shared pool, created on first use
+_executor = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=RENDER_THREADS, thread_name_prefix="raster")
+    return _executor
+
+
+def strip_bounds(height, threads=RENDER_THREADS):
+    """Row ranges [y0, y1) covering the frame"""
+    count = max(1, min(threads * STRIPS_PER_THREAD, height // MIN_STRIP_HEIGHT))
+    edges = np.linspace(0, height, count + 1).astype(int).tolist()
+    return list(zip(edges[:-1], edges[1:]))
+
+
+class TileRasterizer:
+    """
+    Camera mixin drawing non background-colored VMobjects strip by strip
+    Usage: class TiledCamera(TileRasterizer, Camera)
+    """
+
+    def display_multiple_non_background_colored_vmobjects(self, vmobjects, pixel_array):
+        vmobjects = [vm for vm in vmobjects if len(vm.points)]
+        if RENDER_THREADS < 2 or len(vmobjects) < MIN_PARALLEL_MOBJECTS:
+            return super().display_multiple_non_background_colored_vmobjects(vmobjects, pixel_array)
+
+        top, bottom = self.pixel_rows(vmobjects)
+        strips = strip_bounds(self.pixel_height)
+        jobs = []
+        for y0, y1 in strips:
+            indices = np.flatnonzero((bottom >= y0) & (top < y1))
+            if len(indices):
+                jobs.append(get_executor().submit(self.draw_strip, pixel_array, y0, y1, vmobjects, indices))
+        for job in jobs:
+            job.result()
+
+    def pixel_rows(self, vmobjects):
+        """Top and bottom pixel row of every vmobject, stroke included"""
+        lengths = np.array([len(vm.points) for vm in vmobjects])
+        offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        points = np.concatenate([self.transform_points_pre_display(vm, vm.points)[:, 1] for vm in vmobjects])
+        y_min = np.minimum.reduceat(points, offsets)
+        y_max = np.maximum.reduceat(points, offsets)
+
+        scale = self.pixel_height / self.frame_height
+        center_row = self.pixel_height / 2 + self.frame_center[1] * scale
+        widths = np.array([max(vm.get_stroke_width(), vm.get_stroke_width(True)) for vm in vmobjects])
+        margin = widths * self.cairo_line_width_multiple * scale / 2 * MITER_LIMIT + 2
+        return center_row - y_max * scale - margin, center_row - y_min * scale + margin
+
+    def draw_strip(self, pixel_array, y0, y1, vmobjects, indices):
+        """Draw the given vmobjects on a surface over rows [y0, y1)"""
+        pw, ph = self.pixel_width, self.pixel_height
+        fw, fh = self.frame_width, self.frame_height
+        fc = self.frame_center
+        surface = cairo.ImageSurface.create_for_data(pixel_array[y0:y1], cairo.FORMAT_ARGB32, pw, y1 - y0)
+        ctx = cairo.Context(surface)
+        # Same transform as Camera.get_cairo_context, moved up by y0 rows
+        ctx.set_matrix(cairo.Matrix(pw / fw, 0, 0, -(ph / fh), pw / 2 - fc[0] * (pw / fw), ph / 2 + fc[1] * (ph / fh) - y0))
+        for i in indices:
+            self.display_vectorized(vmobjects[i], ctx)
+        surface.flush()
+
+
+class TiledCamera(TileRasterizer, Camera):
+    """Camera rasterizing dense frames on a thread pool"""
+
+
+class TiledRenderMixin:
+    """
+    Scene mixin using TiledCamera
+    Usage: class DigitalRoots9(TiledRenderMixin, StaticHoldMixin, Scene)
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("camera_class", TiledCamera)
+        super().__init__(*args, **kwargs)
@@ -0,0 +1,71 @@
+"""
+MathCLI Pro - Timeline Compiler
+Fuses runs of short sequential self.play() calls into one Succession, so a
+loop of twenty 0.2-0.5s plays becomes a single animation segment (one
+partial movie file, one encoder stream, one hash) instead of twenty.
+
+Inside `with self.timeline():` every play whose run time is at most
+`max_run_time` is recorded instead of rendered. Each play becomes one step
+(an AnimationGroup when it has several animations). The steps are played
+back to back as a Succession when the block ends, before any longer play,
+and before any wait(). Succession sets up and begins each step only when
+its turn comes, so the frames match the separate plays.
+
+Code between recorded plays runs before any of them is rendered. That is
+fine for introducers such as Create, FadeIn and Write, which leave the
+mobject as it was built. Keep .animate / Transform steps whose result later
+code measures outside the block.
+"""
+
+from contextlib import contextmanager
+
+from manim import AnimationGroup, Succession
+
+
+class TimelineMixin:
+    """
+    Scene mixin adding self.timeline()
+    Usage: class FibonacciSpiralBuild(TimelineMixin, StaticHoldMixin, Scene)
+    """
+
+    TIMELINE_MAX_RUN_TIME = 1.0
+
+    _timeline_steps = None
+    _timeline_max_run_time = None
+
+    @contextmanager
+    def timeline(self, max_run_time=None):
+        self._timeline_steps = []
+        self._timeline_max_run_time = max_run_time or self.TIMELINE_MAX_RUN_TIME
+        try:
+            yield
+            self.flush_timeline()
+        finally:
+            self._timeline_steps = None
+
+    def flush_timeline(self):
+        """Play the recorded steps as one Succession"""
+        steps = self._timeline_steps
+        if not steps:
+            return
+        self._timeline_steps = []
+        super().play(steps[0] if len(steps) == 1 else Succession(*steps))
+
+    def play(self, *args, **kwargs):
+        if self._timeline_steps is None or "subcaption" in kwargs:
+            return super().play(*args, **kwargs)
+
+        # Same kwargs handling as Scene.play: run_time, rate_func, ... are
+        # set on each animation
+        animations = self.compile_animations(*args, **kwargs)
+        step = animations[0] if len(animations) == 1 else AnimationGroup(*animations)
+
+        if step.get_run_time() > self._timeline_max_run_time:
+            self.flush_timeline()
+            return super().play(step)
+        self._timeline_steps.append(step)
+
+    def wait(self, *args, **kwargs):
+        if self._timeline_steps:
+            self.flush_timeline()
+        return super().wait(*args, **kwargs)
@@ -0,0 +1,169 @@
+"""
+MathCLI Pro - Ulam Spiral Analytics
+Which diagonals and quadratic rays of the Ulam spiral are richest in primes.
+
+- Diagonals x - y = c ("/" lines) and x + y = c ("\\" lines): prime counts
+  per line are accumulated with np.bincount over chunks of n, so N up to
+  1e8 runs in bounded memory.
+- Quadratic rays a*n^2 + b*n + c (a = 4 gives the spiral's half-diagonals,
+  a = 1 with b = 1, c = 41 is Euler's polynomial): prime density over a
+  whole (b, c) grid, evaluated as one broadcasted array per chunk of b.
+
+Run:
+    python ulam_analytics.py 1000000
+"""
+
+import sys
+
+import numpy as np
+
+from number_theory import prime_sieve, ulam_coords_array
+
+CHUNK = 1 << 22
+
+
+def diagonal_density(n_max, chunk=CHUNK):
+    """
+    Prime statistics for every diagonal of the spiral over 1..n_max
+    Returns {"x-y": (offsets, primes, totals), "x+y": (...)}
+    """
+    mask = prime_sieve(n_max)
+    ring = int(np.ceil((np.sqrt(n_max) - 1) / 2))
+    size = 4 * ring + 1
+    counts = {kind: (np.zeros(size, np.int64), np.zeros(size, np.int64)) for kind in ("x-y", "x+y")}
+
+    for start in range(1, n_max + 1, chunk):
+        n = np.arange(start, min(start + chunk, n_max + 1))
+        x, y = ulam_coords_array(n)
+        is_prime = mask[n]
+        for kind, offset in (("x-y", x - y), ("x+y", x + y)):
+            primes, totals = counts[kind]
+            index = offset + 2 * ring
+            totals += np.bincount(index, minlength=size)
+            primes += np.bincount(index, weights=is_prime, minlength=size).astype(np.int64)
+
+    offsets = np.arange(-2 * ring, 2 * ring + 1)
+    return {kind: (offsets, primes, totals) for kind, (primes, totals) in counts.items()}
+
+
+def top_diagonals(n_max, k=5, min_points=None):
+    """Most prime-dense diagonals, ignoring lines shorter than min_points"""
+    if min_points is None:
+        min_points = max(5, int(np.sqrt(n_max)) // 4)
+
+    ranked = []
+    for kind, (offsets, primes, totals) in diagonal_density(n_max).items():
+        long_enough = totals >= min_points
+        density = np.where(long_enough, primes / np.maximum(totals, 1), -1.0)
+        for i in np.argsort(density)[::-1][:k]:
+            if density[i] < 0:
+                break
+            ranked.append({
+                "kind": kind,
+                "offset": int(offsets[i]),
+                "primes": int(primes[i]),
+                "points": int(totals[i]),
+                "density": float(density[i]),
+            })
+
+    ranked.sort(key=lambda line: line["density"], reverse=True)
+    return ranked[:k]
+
+
+def diagonal_endpoints(kind, offset, n_max, chunk=CHUNK):
+    """Spiral coordinates of the two ends of a diagonal within 1..n_max"""
+    left = right = None
+    for start in range(1, n_max + 1, chunk):
+        x, y = ulam_coords_array(np.arange(start, min(start + chunk, n_max + 1)))
+        on_line = (x - y if kind == "x-y" else x + y) == offset
+        if not on_line.any():
+            continue
+        xs, ys = x[on_line], y[on_line]
+        lo, hi = np.argmin(xs), np.argmax(xs)
+        if left is None or xs[lo] < left[0]:
+            left = (int(xs[lo]), int(ys[lo]))
+        if right is None or xs[hi] > right[0]:
+            right = (int(xs[hi]), int(ys[hi]))
+    return left, right
+
+
+def quadratic_ray_density(n_max, b_values, c_values, a=4, n_terms=None, chunk_b=16):
+    """
+    Prime density of a*n^2 + b*n + c for n = 0..n_terms-1, every (b, c)
+    Values outside 1..n_max are not counted. Returns (primes, totals)
+    as arrays of shape (len(b_values), len(c_values))
+    """
+    mask = prime_sieve(n_max)
+    b_values = np.asarray(b_values, dtype=np.int64)
+    c_values = np.asarray(c_values, dtype=np.int64)
+    if n_terms is None:
+        n_terms = int(np.sqrt(n_max / a)) + 1
+    n = np.arange(n_terms, dtype=np.int64)
+
+    primes = np.zeros((len(b_values), len(c_values)), np.int64)
+    totals = np.zeros_like(primes)
+    for i in range(0, len(b_values), chunk_b):
+        b = b_values[i:i + chunk_b, None, None]
+        values = a * n * n + b * n + c_values[None, :, None]
+        valid = (values >= 1) & (values <= n_max)
+        hits = mask[np.clip(values, 0, n_max)] & valid
+        primes[i:i + chunk_b] = hits.sum(axis=2)
+        totals[i:i + chunk_b] = valid.sum(axis=2)
+    return primes, totals
+
+
+def canonical_ray(a, b, c):
+    """
+    (b, c) of the same polynomial after n -> n + s, with 0 <= b < 2a
+    a(n+s)^2 + b(n+s) + c = a*n^2 + (b + 2as)*n + (a*s^2 + b*s + c)
+    """
+    s = (b % (2 * a) - b) // (2 * a)
+    return b + 2 * a * s, a * s * s + b * s + c
+
+
+def top_quadratic_rays(n_max, k=5, a=4, b_range=(-40, 40), c_range=(-40, 200), min_points=10):
+    """
+    Most prime-dense rays a*n^2 + b*n + c over a (b, c) grid
+    Shifts of one ray (same canonical_ray) are ranked once, by their best entry
+    """
+    b_values = np.arange(b_range[0], b_range[1] + 1)
+    c_values = np.arange(c_range[0], c_range[1] + 1)
+    primes, totals = quadratic_ray_density(n_max, b_values, c_values, a=a)
+    density = np.where(totals >= min_points, primes / np.maximum(totals, 1), -1.0)
+
+    rays, seen = [], set()
+    for flat in np.argsort(density, axis=None, kind="stable")[::-1]:
+        i, j = np.unravel_index(flat, density.shape)
+        if density[i, j] < 0 or len(rays) == k:
+            break
+        key = canonical_ray(a, int(b_values[i]), int(c_values[j]))
+        if key in seen:
+            continue
+        seen.add(key)
+        rays.append({
+            "a": a,
+            "b": int(b_values[i]),
+            "c": int(c_values[j]),
+            "primes": int(primes[i, j]),
+            "points": int(totals[i, j]),
+            "density": float(density[i, j]),
+        })
+    return rays
+
+
+def ray_points(a, b, c, n_max):
+    """Spiral coordinates of a*n^2 + b*n + c inside 1..n_max, in n order"""
+    n = np.arange(int(np.sqrt(n_max / a)) + 2, dtype=np.int64)
+    values = a * n * n + b * n + c
+    values = values[(values >= 1) & (values <= n_max)]
+    return np.column_stack(ulam_coords_array(values))
+
+
+if __name__ == "__main__":
+    n_max = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Top diagonals up to {n_max:,}:")
+    for line in top_diagonals(n_max):
+        print(f"  {line['kind']} = {line['offset']:>6}: {line['primes']}/{line['points']} ({line['density']:.1%})")
+    print("Top 4n^2 + bn + c rays:")
+    for ray in top_quadratic_rays(n_max):
+        print(f"  4n^2 + {ray['b']}n + {ray['c']}: {ray['primes']}/{ray['points']} ({ray['density']:.1%})")
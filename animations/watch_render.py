@@ -0,0 +1,151 @@
+"""
+MathCLI Pro - Watch Mode
+Re-renders one scene every time its module (or a local helper module it
+imports) is saved, re-encoding only the animations that actually changed.
+
+manim already hashes every play() call from the scene's mobjects before the
+play, the animations and their arguments, and the camera state. A segment
+whose hash already has a partial movie file is reused instead of rendered,
+and the final movie is a stream-copy concat of the partial files. Watch
+mode keeps that cache hot and uses it across edits:
+- manim and the scene modules stay imported in a warm parent;
+- each render runs in a forked child that reloads only the edited modules;
+- the cache limit is raised so long scenes keep every segment;
+- each run reports how many segments were rendered and how many reused.
+
+Run:
+    python watch_render.py numerology_v3 PerfectNumbers -q l
+    python watch_render.py numerology_v3 VortexMathDoubling --params '{}'
+"""
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from render_server import warm_up
+from render_variants import QUALITY_FLAGS, check_variants, scene_kwargs
+
+ROOT = Path(__file__).resolve().parent
+POLL_INTERVAL = 0.5
+MAX_FILES_CACHED = 10_000
+
+
+def source_mtimes():
+    """mtime of every local module"""
+    return {path.stem: path.stat().st_mtime_ns for path in ROOT.glob("*.py")}
+
+
+def reload_changed(loaded, current, module_name):
+    """Reload edited local modules, helpers first and the scene module last"""
+    changed = [name for name, mtime in current.items() if loaded.get(name) != mtime and name in sys.modules]
+    for name in changed:
+        if name != module_name:
+            importlib.reload(sys.modules[name])
+    # The scene module holds `from helper import ...` bindings: always refresh
+    # it when anything it may depend on changed
+    if changed:
+        importlib.reload(sys.modules[module_name])
+    return changed
+
+
+def render_once(job, loaded, conn):
+    """Child process: reload, render with the partial movie cache, report reuse"""
+    try:
+        from manim import tempconfig
+
+        changed = reload_changed(loaded, source_mtimes(), job["module"])
+        scene_cls = getattr(sys.modules[job["module"]], job["scene"])
+        options = {
+            "quality": QUALITY_FLAGS[job["quality"]],
+            "preview": False,
+            "disable_caching": False,
+            "max_files_cached": MAX_FILES_CACHED,
+        }
+        with tempconfig(options):
+            start = time.perf_counter()
+            scene = scene_cls(**scene_kwargs(scene_cls, job["params"]))
+            writer = scene.renderer.file_writer
+            partial_dir = Path(writer.partial_movie_directory)
+            before = {path.name for path in partial_dir.glob("*")}
+            scene.render()
+
+            segments = [Path(path) for path in writer.partial_movie_files if path]
+            rendered = sum(1 for path in segments if path.name not in before)
+            conn.send({
+                "ok": True,
+                "changed": changed,
+                "segments": len(segments),
+                "rendered": rendered,
+                "seconds": time.perf_counter() - start,
+                "path": str(writer.movie_file_path),
+            })
+    except Exception:
+        conn.send({"ok": False, "error": traceback.format_exc()})
+    finally:
+        conn.close()
+
+
+def run(job, loaded, context):
+    reader, writer = context.Pipe(duplex=False)
+    child = context.Process(target=render_once, args=(job, loaded, writer))
+    child.start()
+    writer.close()
+    try:
+        result = reader.recv()
+    except EOFError:
+        result = {"ok": False, "error": f"render process exited with code {child.exitcode}"}
+    child.join()
+
+    if not result["ok"]:
+        print(result["error"], file=sys.stderr)
+        return
+    edited = f" after editing {', '.join(result['changed'])}" if result["changed"] else ""
+    print(
+        f"{job['scene']}{edited}: {result['rendered']}/{result['segments']} segments rendered, "
+        f"{result['segments'] - result['rendered']} reused, {result['seconds']:.1f}s -> {result['path']}"
+    )
+
+
+def watch(job):
+    check_variants([dict(job, name="watch")])
+    print(f"Warm in {warm_up([job['module']]):.1f}s, watching {ROOT}")
+    context = multiprocessing.get_context("fork")
+
+    # The warm parent never reloads: each child compares against import time
+    loaded = source_mtimes()
+    run(job, loaded, context)
+    seen = source_mtimes()
+    while True:
+        time.sleep(POLL_INTERVAL)
+        current = source_mtimes()
+        if current != seen:
+            seen = current
+            run(job, loaded, context)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-render a scene on save, reusing unchanged animations")
+    parser.add_argument("module")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=QUALITY_FLAGS, default="l")
+    parser.add_argument("--params", default="{}", help="JSON parameter overrides")
+    args = parser.parse_args()
+
+    try:
+        watch({
+            "module": args.module,
+            "scene": args.scene,
+            "quality": args.quality,
+            "params": json.loads(args.params),
+        })
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
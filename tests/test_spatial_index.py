@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("cairo")
+manim = pytest.importorskip("manim")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "animations"))
+
+from spatial_index import CullingCamera  # noqa: E402
+
+
+def far_group(count=5):
+    return manim.VGroup(*[manim.Dot(manim.RIGHT * (20 + i)) for i in range(count)])
+
+
+def test_static_off_frame_group_is_culled():
+    camera = CullingCamera()
+    group = far_group()
+    camera.reset_spatial_index()
+    assert camera.get_mobjects_to_display([group]) == []
+
+
+def test_updater_on_parent_keeps_children_and_follows_them():
+    camera = CullingCamera()
+    group = far_group()
+    group.add_updater(lambda g: g.move_to(manim.ORIGIN))
+    camera.reset_spatial_index()
+
+    shown = camera.get_mobjects_to_display([group])
+    assert shown == list(group)
+
+    # Children moved or added during the play are picked up on the next frame
+    group.update()
+    group.add(manim.Dot(manim.LEFT * 30))
+    assert camera.get_mobjects_to_display([group]) == list(group)
+
+
+def test_animated_submobject_keeps_its_whole_group():
+    camera = CullingCamera()
+    group = far_group()
+    animation = manim.FadeIn(group[0])
+    camera.reset_spatial_index([animation])
+    assert camera.get_mobjects_to_display([group]) == list(group)
+
+
+def test_dynamic_families_keep_their_place_in_the_scene_order():
+    camera = CullingCamera()
+    before, after = manim.Dot(), manim.Dot(manim.UP)
+    group = far_group(2)
+    group.add_updater(lambda g: g)
+    camera.reset_spatial_index()
+    assert camera.get_mobjects_to_display([before, group, after]) == [before, *group, after]